@@ -0,0 +1,82 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+# Cache of converted records, so a rerun over an export where most visits have
+# not changed only converts the new and edited ones.
+
+import functools
+import hashlib
+import json
+import os
+import typing
+
+import nacc
+from nacc.uds3 import schema
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """
+    Returns the version of nacculator along with a digest of its source and
+    form schemas, so cached conversions are not reused after the code
+    changes, even when the version number does not
+    """
+    try:
+        from importlib import metadata
+        version = metadata.version('nacculator')
+    except Exception:
+        version = 'unknown'
+
+    digest = hashlib.sha256()
+    root = os.path.dirname(nacc.__file__)
+    for directory, subdirectories, files in sorted(os.walk(root)):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(('.py', '.json')):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, root).encode())
+                with open(path, 'rb') as fp:
+                    digest.update(fp.read())
+    return version + '-' + digest.hexdigest()[:16]
+
+
+class ConversionCache(object):
+    """
+    Conversion results kept in a directory, one file per record, keyed by a
+    hash of the record's columns, the nacculator version, the current year
+    (which bounds like "CURRENT_YEAR - 15" depend on) and the mode (which
+    packet type the record is converted as)
+    """
+
+    def __init__(self, directory, mode):
+        self.directory = directory
+        self.prefix = json.dumps([code_version(), schema.CURRENT_YEAR, mode])
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, record: typing.Dict[str, str]) -> str:
+        data = self.prefix + json.dumps(sorted(record.items()))
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str):
+        """ Returns the cached result for the key, or None """
+        try:
+            with open(self._path(key)) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written under a unique name first, so other processes never read
+        # a half written result
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp_path, 'w') as fp:
+            json.dump(result, fp)
+        os.replace(tmp_path, path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
@@ -0,0 +1,329 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+# Exports REDCap records in chunks of ptids, several chunks at a time.
+#
+# Each chunk that is exported is saved in a work directory along with a
+# manifest of the chunks, so an export that is interrupted or fails can be
+# run again and only exports the chunks that are missing. Once every chunk is
+# exported the manifest is marked complete, and the next export starts over.
+# Optionally, the exported records are kept in a RecordStore so later exports
+# only ask REDCap for the records modified since.
+
+import concurrent.futures
+import datetime
+import json
+import os
+import sqlite3
+import sys
+import time
+import typing
+
+MANIFEST = 'manifest.json'
+
+_TIMESTAMP = '%Y-%m-%d %H:%M:%S'
+
+# How far before the last export to ask REDCap for modified records, so clock
+# differences with the server or a record saved mid-export are not missed.
+# Records exported twice are just stored again.
+EXPORT_OVERLAP = datetime.timedelta(hours=1)
+
+
+class ExportError(Exception):
+    """ Raised when some chunks could not be exported """
+    pass
+
+
+def unique_ptids(records: typing.Iterable[dict]) -> typing.List[str]:
+    """ Returns the ptids of the records, without duplicates, in order """
+    return list(dict.fromkeys(record['ptid'] for record in records))
+
+
+def export_in_chunks(export_records, ptids, workdir, chunk_size=50,
+                     workers=4, retries=3, backoff=1.0, sleep=time.sleep,
+                     err=sys.stderr, fields=None) -> typing.Iterator[dict]:
+    """
+    Exports the records of the ptids and returns them in the order of the
+    ptids (the records of each ptid in the order REDCap returns them).
+
+    `export_records` is called with a list of ptids and returns their records,
+    like PyCap's `Project.export_records(records=...)`. Up to `workers` chunks
+    of `chunk_size` ptids are exported at once. A chunk is tried `retries`
+    times, waiting `backoff` seconds and then twice as long after each
+    failure. If it still fails, it is split in half and each half is
+    exported the same way, so a chunk that is too big for the server still
+    gets exported in smaller pieces.
+
+    Finished chunks are saved in `workdir`. If any chunk fails, ExportError
+    is raised after the others finish, and calling this again with the same
+    ptids and `fields` (the fields `export_records` asks for, None for all)
+    only exports the chunks that are missing. An export that finished is
+    never reused: the next call exports everything again.
+    """
+    chunks = _load_manifest(workdir, ptids, chunk_size, fields)
+    missing = [i for i in range(len(chunks))
+               if not os.path.exists(_chunk_path(workdir, i))]
+
+    def export_chunk(i):
+        rows = _export_splitting(export_records, chunks[i], retries, backoff,
+                                 sleep, err)
+        _write_json(_chunk_path(workdir, i), rows)
+
+    failed = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(export_chunk, i): i for i in missing}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed.append(futures[future])
+                print("Could not export chunk %d: %s" % (futures[future], e),
+                      file=err)
+
+    if failed:
+        raise ExportError("%d of %d chunks could not be exported; run the "
+                          "export again to retry them" %
+                          (len(failed), len(chunks)))
+
+    _complete_manifest(workdir)
+    return _read_chunks(workdir, len(chunks))
+
+
+class RecordStore(object):
+    """
+    Records exported from REDCap before, kept in a SQLite database so that
+    later exports only need the records modified since
+    """
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " seq INTEGER PRIMARY KEY, ptid TEXT NOT NULL,"
+                " data TEXT NOT NULL)")
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS records_ptid ON records (ptid)")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS exports ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0), exported_at TEXT,"
+                " fields TEXT)")
+
+    def close(self):
+        self.db.close()
+
+    def last_export(self, fields=None) -> typing.Optional[datetime.datetime]:
+        """
+        Returns when the last successful export of the fields (None for all
+        of them) started, if any
+        """
+        row = self.db.execute(
+            "SELECT exported_at, fields FROM exports WHERE id = 0").fetchone()
+        if row is None or row[1] != json.dumps(fields):
+            return None
+        return datetime.datetime.strptime(row[0], _TIMESTAMP)
+
+    def replace_all(self, rows, exported_at, fields=None):
+        """ Replaces every stored record with the rows of a full export """
+        with self.db:
+            self.db.execute("DELETE FROM records")
+            self._insert(rows)
+            self._exported(exported_at, fields)
+
+    def update(self, rows, ptids, exported_at, fields=None):
+        """
+        Replaces the stored records of the ptids in rows (all the rows of
+        each modified record) and drops any ptid that is no longer in ptids
+        """
+        rows = list(rows)
+        with self.db:
+            for ptid in unique_ptids(rows):
+                self.db.execute("DELETE FROM records WHERE ptid = ?",
+                                (ptid,))
+            self.db.execute("CREATE TEMP TABLE current (ptid TEXT)")
+            self.db.executemany("INSERT INTO current VALUES (?)",
+                                ((ptid,) for ptid in ptids))
+            self.db.execute("DELETE FROM records WHERE ptid NOT IN"
+                            " (SELECT ptid FROM current)")
+            self.db.execute("DROP TABLE current")
+            self._insert(rows)
+            self._exported(exported_at, fields)
+
+    def records(self, ptids) -> typing.Iterator[dict]:
+        """ Returns the stored records of the ptids, in order """
+        for ptid in ptids:
+            for data, in self.db.execute(
+                    "SELECT data FROM records WHERE ptid = ? ORDER BY seq",
+                    (ptid,)):
+                yield json.loads(data)
+
+    def _insert(self, rows):
+        self.db.executemany("INSERT INTO records (ptid, data) VALUES (?, ?)",
+                            ((row['ptid'], json.dumps(row)) for row in rows))
+
+    def _exported(self, exported_at, fields):
+        self.db.execute("INSERT OR REPLACE INTO exports VALUES (0, ?, ?)",
+                        (exported_at.strftime(_TIMESTAMP), json.dumps(fields)))
+
+
+def export_with_store(export_records, export_modified, ptids, workdir, store,
+                      now=datetime.datetime.now, fields=None, retries=3,
+                      backoff=1.0, sleep=time.sleep, err=sys.stderr,
+                      **kwargs):
+    """
+    Exports the records of the ptids using the store of the records exported
+    before, and returns them in the order of the ptids.
+
+    The first time, everything is exported with export_in_chunks (`kwargs`
+    are passed to it) and stored. After that, only the records modified since
+    the last export are, with `export_modified`, which is called with a
+    datetime and returns the rows of the records modified since, like PyCap's
+    `Project.export_records(date_range_begin=...)`. It is retried like a
+    chunk, and ExportError is raised if it still fails. If the exported
+    `fields` are not the ones stored, everything is exported again.
+    """
+    started = now()
+    since = store.last_export(fields)
+    if since is None:
+        store.replace_all(
+            export_in_chunks(export_records, ptids, workdir, retries=retries,
+                             backoff=backoff, sleep=sleep, err=err,
+                             fields=fields, **kwargs),
+            started, fields)
+    else:
+        begin = since - EXPORT_OVERLAP
+        description = "Export of the records modified since %s" % begin
+        try:
+            rows = _retrying(lambda: list(export_modified(begin)),
+                             description, retries, backoff, sleep, err)
+        except Exception as e:
+            raise ExportError("%s failed: %s" % (description, e)) from e
+        store.update(rows, ptids, started, fields)
+    return store.records(ptids)
+
+
+def project_fields(export_field_names, forms, wanted) \
+        -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """
+    Returns the fields of the project to ask the API for (its `fields`
+    parameter) and the CSV columns they are exported as, keeping only the
+    fields with a column in `wanted`.
+
+    `export_field_names` is like PyCap's `Project.export_field_names()` and
+    `forms` are the project's instruments, whose "<form>_complete" status
+    fields are not in it.
+    """
+    fields = dict()
+    exported = dict()
+    for field in export_field_names:
+        name = field['original_field_name']
+        column = field['export_field_name']
+        if column in wanted or name in wanted:
+            fields[name] = None
+            exported[column] = None
+    for form in forms:
+        name = form + '_complete'
+        if name in wanted:
+            fields[name] = None
+            exported[name] = None
+    return list(fields), list(exported)
+
+
+def _export_splitting(export_records, ptids, retries, backoff, sleep, err):
+    try:
+        return _export_retrying(export_records, ptids, retries, backoff,
+                                sleep, err)
+    except Exception:
+        if len(ptids) < 2:
+            raise
+    half = len(ptids) // 2
+    print("Splitting chunk of %d ptids starting with %s" %
+          (len(ptids), ptids[0]), file=err)
+    return _export_splitting(export_records, ptids[:half], retries, backoff,
+                             sleep, err) + \
+        _export_splitting(export_records, ptids[half:], retries, backoff,
+                          sleep, err)
+
+
+def _export_retrying(export_records, ptids, retries, backoff, sleep, err):
+    return _retrying(lambda: list(export_records(ptids)),
+                     "Export of %d ptids starting with %s" %
+                     (len(ptids), ptids[0]), retries, backoff, sleep, err)
+
+
+def _retrying(export, description, retries, backoff, sleep, err):
+    """
+    Returns what `export` returns, calling it up to `retries` times, waiting
+    `backoff` seconds and then twice as long after each failure
+    """
+    for attempt in range(retries):
+        try:
+            return export()
+        except Exception as e:
+            if attempt == retries - 1:
+                raise
+            delay = backoff * 2 ** attempt
+            print("%s failed (%s), retrying in %.1fs" %
+                  (description, e, delay), file=err)
+            sleep(delay)
+
+
+def _load_manifest(workdir, ptids, chunk_size, fields):
+    """
+    Returns the chunks of the export in the work directory, starting a new
+    export there unless the previous one did not finish and was for the same
+    ptids and fields
+    """
+    os.makedirs(workdir, exist_ok=True)
+    manifest_path = os.path.join(workdir, MANIFEST)
+    if fields is not None:
+        fields = list(fields)
+    try:
+        with open(manifest_path) as fp:
+            manifest = json.load(fp)
+        if not manifest.get('complete') and \
+                manifest['ptids'] == list(ptids) and \
+                manifest['fields'] == fields:
+            return manifest['chunks']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    for name in os.listdir(workdir):
+        if name.startswith('chunk_'):
+            os.remove(os.path.join(workdir, name))
+    chunks = [list(ptids[i:i + chunk_size])
+              for i in range(0, len(ptids), chunk_size)]
+    _write_json(manifest_path, {'ptids': list(ptids), 'fields': fields,
+                                'chunks': chunks})
+    return chunks
+
+
+def _complete_manifest(workdir):
+    """ Marks the export in the work directory as finished """
+    manifest_path = os.path.join(workdir, MANIFEST)
+    with open(manifest_path) as fp:
+        manifest = json.load(fp)
+    manifest['complete'] = True
+    _write_json(manifest_path, manifest)
+
+
+def _read_chunks(workdir, count):
+    for i in range(count):
+        with open(_chunk_path(workdir, i)) as fp:
+            rows = json.load(fp)
+        yield from rows
+
+
+def _chunk_path(workdir, i):
+    return os.path.join(workdir, 'chunk_%05d.json' % i)
+
+
+def _write_json(path, data):
+    # Written under another name first so a chunk is never half saved
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as fp:
+        json.dump(data, fp)
+    os.replace(tmp_path, path)
@@ -8,6 +8,7 @@ import csv
 import os
 import re
 import sys
+import typing
 
 
 def convert_rule_to_python(name: str, rule: str) -> bool:
@@ -26,60 +27,27 @@ def convert_rule_to_python(name: str, rule: str) -> bool:
     :param name: Canonical name of the field
     :param rule: Blanking rule text
     """
+    return compile_rule(name, rule, parse_rule(name, rule))
 
-    special_cases = {
-        'FTDCPC2F': _blanking_rule_dummy,  # "Blank if form completed"
 
-        'FTDMRIRF': _blanking_rule_ftld_or2,
-        'FTDMRILF': _blanking_rule_ftld_or2,
-        'FTDMRIRT': _blanking_rule_ftld_or2,
-        'FTDMRILT': _blanking_rule_ftld_or2,
-        'FTDMRIRM': _blanking_rule_ftld_or2,
-        'FTDMRILM': _blanking_rule_ftld_or2,
-        'FTDMRIRP': _blanking_rule_ftld_or2,
-        'FTDMRILP': _blanking_rule_ftld_or2,
-        'FTDMRIRB': _blanking_rule_ftld_or2,
-        'FTDMRILB': _blanking_rule_ftld_or2,
-        'FTDMRIOB': _blanking_rule_ftld_or2,
-        'FTDMRIOS': _blanking_rule_ftld_or2a,
-        'FTDFDGRF': _blanking_rule_ftld_or3,
-        'FTDFDGLF': _blanking_rule_ftld_or3,
-        'FTDFDGRT': _blanking_rule_ftld_or3,
-        'FTDFDGLT': _blanking_rule_ftld_or3,
-        'FTDFDGRM': _blanking_rule_ftld_or3,
-        'FTDFDGLM': _blanking_rule_ftld_or3,
-        'FTDFDGRP': _blanking_rule_ftld_or3,
-        'FTDFDGLP': _blanking_rule_ftld_or3,
-        'FTDFDGRB': _blanking_rule_ftld_or3,
-        'FTDFDGLB': _blanking_rule_ftld_or3,
-        'FTDFDGOA': _blanking_rule_ftld_or3,
-        'FTDFDGOS': _blanking_rule_ftld_or3a,
-        'FTDAMYRF': _blanking_rule_ftld_or4,
-        'FTDAMYLF': _blanking_rule_ftld_or4,
-        'FTDAMYRT': _blanking_rule_ftld_or4,
-        'FTDAMYLT': _blanking_rule_ftld_or4,
-        'FTDAMYRM': _blanking_rule_ftld_or4,
-        'FTDAMYLM': _blanking_rule_ftld_or4,
-        'FTDAMYRP': _blanking_rule_ftld_or4,
-        'FTDAMYLP': _blanking_rule_ftld_or4,
-        'FTDAMYRB': _blanking_rule_ftld_or4,
-        'FTDAMYLB': _blanking_rule_ftld_or4,
-        'FTDAMYOA': _blanking_rule_ftld_or4,
-        'FTDAMYOS': _blanking_rule_ftld_or4a,
-        'FTDCBFRF': _blanking_rule_ftld_or5,
-        'FTDCBFLF': _blanking_rule_ftld_or5,
-        'FTDCBFRT': _blanking_rule_ftld_or5,
-        'FTDCBFLT': _blanking_rule_ftld_or5,
-        'FTDCBFRM': _blanking_rule_ftld_or5,
-        'FTDCBFLM': _blanking_rule_ftld_or5,
-        'FTDCBFRP': _blanking_rule_ftld_or5,
-        'FTDCBFLP': _blanking_rule_ftld_or5,
-        'FTDCBFRB': _blanking_rule_ftld_or5,
-        'FTDCBFLB': _blanking_rule_ftld_or5,
-        'FTDCBFOA': _blanking_rule_ftld_or5,
-        'FTDCBFOS': _blanking_rule_ftld_or5a,
+def parse_rule(name: str, rule: str) -> tuple:
+    """
+    Parses the text `rule` into an entry of a compiled rule table, which
+    compile_rule turns into a python function. tools/generator.py stores the
+    entries of each form's rules with the form, so they are parsed (and fail
+    to parse) when the forms are generated instead of for every run.
+
+    The entry is the kind of rule and then its arguments:
+        ("special",)                   handled in code for the field `name`
+        ("range", key, eq, start, stop)
+        ("value", key, eq, value)
+        ("blank", key, eq)
+        ("values", key, eq, value...)  key is (or is not) one of the values
+        ("never",)                     never blank
 
-    }
+    :param name: Canonical name of the field
+    :param rule: Blanking rule text
+    """
 
     single_value = re.compile(
         r"Blank if( Question(s?))? *\w+(,?) (?P<key>\w+)(,?)"
@@ -93,37 +61,67 @@ def convert_rule_to_python(name: str, rule: str) -> bool:
         r"Blank if question not answered")
 
     # First, check to see if the rule is a "Special Case"
-    if name in special_cases:
-        return special_cases[name](rule)
+    if _special_case(name):
+        return ('special',)
+
+    # The rules of the imaging fields are one of the conditions of their
+    # question; any other rule never applies to them
+    if name in _IMAGING_FIELDS:
+        return _IMAGING_FIELDS[name].get(rule, ('never',))
 
     # Then, check to see if the rule is of the within-range type
     m = range_values.match(rule)
     if m:
-        return _blanking_rule_check_within_range(
-            m.group('key'), m.group('eq'), m.group('start'), m.group('stop'))
+        return ('range', m.group('key'), m.group('eq'), int(m.group('start')),
+                int(m.group('stop')))
 
     # Next, check to see if the rule is of the single-value type
     m = single_value.match(rule)
     if m:
-        return _blanking_rule_check_single_value(
-            m.group('key'), m.group('eq'), m.group('value'))
+        return ('value', m.group('key'), m.group('eq'), m.group('value'))
 
     # Next, check to see if the rule is of the "blank if _ = blank" type
     m = blank_value.match(rule)
     if m:
-        return _blanking_rule_check_blank_value(
-            m.group('key'), m.group('eq'))
+        return ('blank', m.group('key'), m.group('eq'))
 
     # For the FTLD forms, we need to also check to see if
     # "Blank if question not answered" is included in the blanking rules
     m = not_answered.match(rule)
     if m:
-        return lambda packet: False
+        return ('never',)
 
     # Finally, raise an error since we do not know how to handle the rule
     raise Exception("Could not parse Blanking rule: "+name)
 
 
+def compile_rule(name: str, rule: str, entry) -> typing.Callable:
+    """ Returns the python function for an entry made by parse_rule """
+    kind = entry[0]
+    if kind == 'special':
+        return _special_case(name)(rule)
+    elif kind == 'range':
+        return _blanking_rule_check_within_range(*entry[1:])
+    elif kind == 'value':
+        return _blanking_rule_check_single_value(*entry[1:])
+    elif kind == 'blank':
+        return _blanking_rule_check_blank_value(*entry[1:])
+    elif kind == 'values':
+        return _blanking_rule_check_any_value(*entry[1:])
+    elif kind == 'never':
+        return lambda packet: False
+    else:
+        raise ValueError("Unknown kind of blanking rule: %s" % (kind,))
+
+
+def _special_case(name):
+    """ Returns the function for the rules of a "Special Case" field """
+    special_cases = {
+        'FTDCPC2F': _blanking_rule_dummy,  # "Blank if form completed"
+    }
+    return special_cases.get(name)
+
+
 def extract_blanks(csvfile):
     with open(csvfile) as fp:
         reader = csv.DictReader(fp)
@@ -148,139 +146,108 @@ def _blanking_rule_check_single_value(key, eq, value):
 
 
 def _blanking_rule_check_within_range(key, eq, start, stop):
+    first = int(start)
+    last = int(stop)
+
     def should_be_blank(packet):
         """ Returns True if the value should be blank according to the rule """
-        first = int(start)
-        last = int(stop)+1
         if '=' == eq:
-            return packet[key] in range(first, last)
+            return packet[key].within(first, last)
         elif 'ne' == eq:
-            return packet[key] not in list(range(first, last))
+            return not packet[key].within(first, last)
         else:
             raise ValueError("'eq' must be '=' or 'ne', not '%s'." % eq)
 
     return should_be_blank
 
 
-def _blanking_rule_check_blank_value(key, eq, value=None):
+def _blanking_rule_check_any_value(key, eq, *values):
     def should_be_blank(packet):
         """ Returns True if the value should be blank according to the rule """
         if '=' == eq:
-            return packet[key] == value
+            return packet[key] in values
         elif 'ne' == eq:
-            return packet[key] != value
+            return packet[key] not in values
         else:
             raise ValueError("'eq' must be '=' or 'ne', not '%s'." % eq)
 
     return should_be_blank
 
 
-def _blanking_rule_ftld_or2(rule):
-    """ Blank if either of 2 possibilities is true (= 0 (No) or = 9 (Unknown))
-    Along with other regular conditions """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 2 FTDSMRIO = 0 (No)':
-        return lambda packet: packet['FTDSMRIO'] == 0
-    elif rule == 'Blank if Question 2a, FTDMRIFA, = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDMRIFA'] in (0, 9)
-    else:
-        return lambda packet: False
-
-
-def _blanking_rule_ftld_or2a(rule):
-    """
-    Blank if either of 2 possibilities is true (= 0 (No) or = 9 (Unknown))
-    This rule has an additional condition compared to
-    the others in this form """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 2 FTDSMRIO = 0 (No)':
-        return lambda packet: packet['FTDSMRIO'] == 0
-    elif rule == 'Blank if Question 2a, FTDMRIFA, = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDMRIFA'] in (0, 9)
-    elif rule == 'Blank if Question 2a11 FTDMRIOB ne 1 (Yes)':
-        return lambda packet: packet['FTDMRIOB'] != 1
-    else:
-        return lambda packet: False
-
-
-def _blanking_rule_ftld_or3(rule):
-    """ See _blanking_rule_ftld_or2 for rules """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 3 FTDFDGPE = 0 (No)':
-        return lambda packet: packet['FTDFDGPE'] == 0
-    elif rule == 'Blank if Question 3a FTDFDGFh = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDFDGFh'] in (0, 9)
-    else:
-        return lambda packet: False
-
-
-def _blanking_rule_ftld_or3a(rule):
-    """ See _blanking_rule_ftld_or2a for rules """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 3 FTDFDGPE = 0 (No)':
-        return lambda packet: packet['FTDFDGPE'] == 0
-    elif rule == 'Blank if Question 3a FTDFDGFh = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDFDGFh'] in (0, 9)
-    elif rule == 'Blank if Question 3a11, FTDFDGOA, ne 1 (Yes)':
-        return lambda packet: packet['FTDFDGOA'] != 1
-    else:
-        return lambda packet: False
-
-
-def _blanking_rule_ftld_or4(rule):
-    """ See _blanking_rule_ftld_or2 for rules """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 4 FTDAMYP = 0 (No)':
-        return lambda packet: packet['FTDAMYP'] == 0
-    elif rule == 'Blank if Question 4a FTDAMYVI = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDAMYVI'] in (0, 9)
-    else:
-        return lambda packet: False
-
-
-def _blanking_rule_ftld_or4a(rule):
-    """ See _blanking_rule_ftld_or2a for rules """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 4 FTDAMYP = 0 (No)':
-        return lambda packet: packet['FTDAMYP'] == 0
-    elif rule == 'Blank if Question 4a FTDAMYVI = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDAMYVI'] in (0, 9)
-    elif rule == 'Blank if Question 4a11, FTDAMYOA, ne 1 (Yes)':
-        return lambda packet: packet['FTDAMYOA'] != 1
-    else:
-        return lambda packet: False
-
+def _blanking_rule_check_blank_value(key, eq, value=None):
+    def should_be_blank(packet):
+        """ Returns True if the value should be blank according to the rule """
+        if '=' == eq:
+            return packet[key] == value
+        elif 'ne' == eq:
+            return packet[key] != value
+        else:
+            raise ValueError("'eq' must be '=' or 'ne', not '%s'." % eq)
 
-def _blanking_rule_ftld_or5(rule):
-    """ See _blanking_rule_ftld_or2 for rules """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 5 FTDCBFSP = 0 (No)':
-        return lambda packet: packet['FTDCBFSP'] == 0
-    elif rule == 'Blank if Question 5a FTDCBFVI = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDCBFVI'] in (0, 9)
-    else:
-        return lambda packet: False
+    return should_be_blank
 
 
-def _blanking_rule_ftld_or5a(rule):
-    """ See _blanking_rule_ftld_or2a for rules """
-    if rule == 'Blank if Question 1 FTDIDIAG = 0 (No)':
-        return lambda packet: packet['FTDIDIAG'] == 0
-    elif rule == 'Blank if Question 5 FTDCBFSP = 0 (No)':
-        return lambda packet: packet['FTDCBFSP'] == 0
-    elif rule == 'Blank if Question 5a FTDCBFVI = 0 (No) or 9 (Unknown)':
-        return lambda packet: packet['FTDCBFVI'] in (0, 9)
-    elif rule == 'Blank if Question 5a11, FTDCBFOA, ne 1 (Yes)':
-        return lambda packet: packet['FTDCBFOA'] != 1
-    else:
-        return lambda packet: False
+# The rules of the imaging fields of form E3F (MRI, FDG PET, amyloid PET and
+# CBF SPECT), by question. Each rule is a plain condition shared by every
+# field of its question (and FTDIDIAG by all of them), so check_blanks only
+# evaluates it once for a packet.
+_FTDIDIAG = {
+    'Blank if Question 1 FTDIDIAG = 0 (No)': ('value', 'FTDIDIAG', '=', '0'),
+}
+_IMAGING_RULES = {
+    'MRI': dict(_FTDIDIAG, **{
+        'Blank if Question 2 FTDSMRIO = 0 (No)':
+            ('value', 'FTDSMRIO', '=', '0'),
+        'Blank if Question 2a, FTDMRIFA, = 0 (No) or 9 (Unknown)':
+            ('values', 'FTDMRIFA', '=', '0', '9'),
+    }),
+    'FDG': dict(_FTDIDIAG, **{
+        'Blank if Question 3 FTDFDGPE = 0 (No)':
+            ('value', 'FTDFDGPE', '=', '0'),
+        'Blank if Question 3a FTDFDGFh = 0 (No) or 9 (Unknown)':
+            ('values', 'FTDFDGFh', '=', '0', '9'),
+    }),
+    'AMY': dict(_FTDIDIAG, **{
+        'Blank if Question 4 FTDAMYP = 0 (No)':
+            ('value', 'FTDAMYP', '=', '0'),
+        'Blank if Question 4a FTDAMYVI = 0 (No) or 9 (Unknown)':
+            ('values', 'FTDAMYVI', '=', '0', '9'),
+    }),
+    'CBF': dict(_FTDIDIAG, **{
+        'Blank if Question 5 FTDCBFSP = 0 (No)':
+            ('value', 'FTDCBFSP', '=', '0'),
+        'Blank if Question 5a FTDCBFVI = 0 (No) or 9 (Unknown)':
+            ('values', 'FTDCBFVI', '=', '0', '9'),
+    }),
+}
+# The "other" field of each question also depends on whether another region
+# was found
+_IMAGING_OTHER_RULES = {
+    'FTDMRIOS': dict(_IMAGING_RULES['MRI'], **{
+        'Blank if Question 2a11 FTDMRIOB ne 1 (Yes)':
+            ('value', 'FTDMRIOB', 'ne', '1'),
+    }),
+    'FTDFDGOS': dict(_IMAGING_RULES['FDG'], **{
+        'Blank if Question 3a11, FTDFDGOA, ne 1 (Yes)':
+            ('value', 'FTDFDGOA', 'ne', '1'),
+    }),
+    'FTDAMYOS': dict(_IMAGING_RULES['AMY'], **{
+        'Blank if Question 4a11, FTDAMYOA, ne 1 (Yes)':
+            ('value', 'FTDAMYOA', 'ne', '1'),
+    }),
+    'FTDCBFOS': dict(_IMAGING_RULES['CBF'], **{
+        'Blank if Question 5a11, FTDCBFOA, ne 1 (Yes)':
+            ('value', 'FTDCBFOA', 'ne', '1'),
+    }),
+}
+_IMAGING_REGIONS = ('RF', 'LF', 'RT', 'LT', 'RM', 'LM', 'RP', 'LP', 'RB',
+                    'LB')
+# The conditions of the rules of each imaging field, by rule text
+_IMAGING_FIELDS = {
+    'FTD%s%s' % (question, region): rules
+    for question, rules in _IMAGING_RULES.items()
+    for region in _IMAGING_REGIONS + ('OB' if question == 'MRI' else 'OA',)}
+_IMAGING_FIELDS.update(_IMAGING_OTHER_RULES)
 
 
 def _blanking_rule_dummy(rule):
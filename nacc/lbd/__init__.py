@@ -56,8 +56,8 @@ class Field(object):
         self.inclusive_range = inclusive_range
         # get the canonical representation for allowable values, but filter out
         # empty strings first
-        self.allowable_values = [self.udstype(v)
-                                 for v in [_f for _f in allowable_values if _f]]
+        self.allowable_values = frozenset(
+            self.udstype(v) for v in allowable_values or [] if v)
         self.blanks = blanks or []
         self.val = value
 
@@ -77,7 +77,9 @@ class Field(object):
     @value.setter
     def value(self, val):
         def out_of_range(v):
-            d = decimal.Decimal(v)
+            # whole numbers are compared as ints, anything else as a Decimal
+            digits = v.strip(' ')
+            d = int(digits) if digits.isdecimal() else decimal.Decimal(v)
             return d < self.inclusive_range[0] or d > self.inclusive_range[1]
 
         if self.allowable_values:
@@ -8,6 +8,7 @@ import csv
 import os
 import re
 import sys
+import typing
 
 
 def convert_rule_to_python(name: str, rule: str) -> bool:
@@ -26,25 +27,24 @@ def convert_rule_to_python(name: str, rule: str) -> bool:
     :param name: Canonical name of the field
     :param rule: Blanking rule text
     """
+    return compile_rule(name, rule, parse_rule(name, rule))
 
-    special_cases = {
-        'LBDeLAGe': _blanking_rule_lbd,
-        'LBDeLMeD': _blanking_rule_lbd,
-        'LBDeLMD1': _blanking_rule_lbd,
-        'LBDeLMD2': _blanking_rule_lbd,
-        'LBHALAGe': _blanking_rule_lbd,
-        'LBHALMeD': _blanking_rule_lbd,
-        'LBHALMD1': _blanking_rule_lbd,
-        'LBHALMD2': _blanking_rule_lbd,
-        'LBANXAGe': _blanking_rule_lbd,
-        'LBANXMeD': _blanking_rule_lbd,
-        'LBANXMD1': _blanking_rule_lbd,
-        'LBANXMD2': _blanking_rule_lbd,
-        'LBAPAAGe': _blanking_rule_lbd,
-        'LBAPAMeD': _blanking_rule_lbd,
-        'LBAPAMD1': _blanking_rule_lbd,
-        'LBAPAMD2': _blanking_rule_lbd,
-    }
+
+def parse_rule(name: str, rule: str) -> tuple:
+    """
+    Parses the text `rule` into an entry of a compiled rule table, which
+    compile_rule turns into a python function. tools/generator.py stores the
+    entries of each form's rules with the form, so they are parsed (and fail
+    to parse) when the forms are generated instead of for every run.
+
+    The entry is the kind of rule and then its arguments:
+        ("special",)                   handled in code for the field `name`
+        ("range", key, eq, start, stop)
+        ("value", key, eq, value)
+
+    :param name: Canonical name of the field
+    :param rule: Blanking rule text
+    """
 
     single_value = re.compile(
         r"Blank if( Question(s?))? *\w+ (?P<key>\w+) *(?P<eq>=|ne)"
@@ -54,25 +54,60 @@ def convert_rule_to_python(name: str, rule: str) -> bool:
         r" (?P<start>\d+)-(?P<stop>\d+)( |$)")
 
     # First, check to see if the rule is a "Special Case"
-    if name in special_cases:
-        return special_cases[name]()
+    if _special_case(name):
+        return ('special',)
 
     # Then, check to see if the rule is of the within-range type
     m = range_values.match(rule)
     if m:
-        return _blanking_rule_check_within_range(
-            m.group('key'), m.group('eq'), m.group('start'), m.group('stop'))
+        return ('range', m.group('key'), m.group('eq'), int(m.group('start')),
+                int(m.group('stop')))
 
     # Next, check to see if the rule is of the single-value type
     m = single_value.match(rule)
     if m:
-        return _blanking_rule_check_single_value(
-            m.group('key'), m.group('eq'), m.group('value'))
+        return ('value', m.group('key'), m.group('eq'), m.group('value'))
 
     # Finally, raise an error since we do not know how to handle the rule
     raise Exception("Could not parse Blanking rule: "+name)
 
 
+def compile_rule(name: str, rule: str, entry) -> typing.Callable:
+    """ Returns the python function for an entry made by parse_rule """
+    kind = entry[0]
+    if kind == 'special':
+        return _special_case(name)()
+    elif kind == 'range':
+        return _blanking_rule_check_within_range(*entry[1:])
+    elif kind == 'value':
+        return _blanking_rule_check_single_value(*entry[1:])
+    else:
+        raise ValueError("Unknown kind of blanking rule: %s" % (kind,))
+
+
+def _special_case(name):
+    """ Returns the function for the rules of a "Special Case" field """
+    special_cases = {
+        'LBDeLAGe': _blanking_rule_lbd,
+        'LBDeLMeD': _blanking_rule_lbd,
+        'LBDeLMD1': _blanking_rule_lbd,
+        'LBDeLMD2': _blanking_rule_lbd,
+        'LBHALAGe': _blanking_rule_lbd,
+        'LBHALMeD': _blanking_rule_lbd,
+        'LBHALMD1': _blanking_rule_lbd,
+        'LBHALMD2': _blanking_rule_lbd,
+        'LBANXAGe': _blanking_rule_lbd,
+        'LBANXMeD': _blanking_rule_lbd,
+        'LBANXMD1': _blanking_rule_lbd,
+        'LBANXMD2': _blanking_rule_lbd,
+        'LBAPAAGe': _blanking_rule_lbd,
+        'LBAPAMeD': _blanking_rule_lbd,
+        'LBAPAMD1': _blanking_rule_lbd,
+        'LBAPAMD2': _blanking_rule_lbd,
+    }
+    return special_cases.get(name)
+
+
 def extract_blanks(csvfile):
     with open(csvfile) as fp:
         reader = csv.DictReader(fp)
@@ -97,14 +132,15 @@ def _blanking_rule_check_single_value(key, eq, value):
 
 
 def _blanking_rule_check_within_range(key, eq, start, stop):
+    first = int(start)
+    last = int(stop)
+
     def should_be_blank(packet):
         """ Returns True if the value should be blank according to the rule """
-        first = int(start)
-        last = int(stop)+1
         if '=' == eq:
-            return packet[key] in range(first, last)
+            return packet[key].within(first, last)
         elif 'ne' == eq:
-            return packet[key] not in list(range(first, last))
+            return not packet[key].within(first, last)
         else:
             raise ValueError("'eq' must be '=' or 'ne', not '%s'." % eq)
 
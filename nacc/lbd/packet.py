@@ -4,8 +4,10 @@
 # Use of this source code is governed by the license found in the LICENSE file.
 ###############################################################################
 
+from nacc.uds3 import packet as uds3_packet
 
-class Packet(list):
+
+class Packet(uds3_packet.Packet):
     """
     A collection of LBD Forms
 
@@ -13,18 +15,4 @@ class Packet(list):
     named, regardless of which form they are in.
     """
 
-    def __init__(self):
-        self._cache = dict()
-
-    def __getitem__(self, key):
-        """
-        Searches through each form in the packet for the field, `key`
-
-        Example:
-            packet['RESTTRL'] is equivalent to:
-            packet.__getitem__('RESTTRL')
-        """
-        if key in self._cache:
-            return self._cache[key]
-
-        raise KeyError(key)
+    MULTI_INSTANCE_FORMS = frozenset()
@@ -7,89 +7,275 @@
 ###############################################################################
 
 import argparse
+import collections
 import csv
+import functools
+import importlib
+import io
+import itertools
+import multiprocessing
+import os
 import re
 import sys
 import traceback
 import typing
 
+from nacc import cache as conversion_cache
 from nacc.uds3 import blanks as blanks_uds3
 from nacc.lbd import blanks as blanks_lbd
 from nacc.ftld import blanks as blanks_ftld
 from nacc.csf import blanks as blanks_csf
 from nacc.cv import blanks as blanks_cv
-from nacc.uds3.ivp import builder as ivp_builder
-from nacc.uds3.np import builder as np_builder
-from nacc.uds3.fvp import builder as fvp_builder
-from nacc.uds3.tfp import builder as tfp_builder
-from nacc.uds3.tfp.v3_2 import builder as tfp_new_builder
-from nacc.uds3.m import builder as m_builder
-from nacc.lbd.ivp import builder as lbd_ivp_builder
-from nacc.lbd.fvp import builder as lbd_fvp_builder
-from nacc.lbd.v3_1.ivp import builder as lbd_short_ivp_builder
-from nacc.lbd.v3_1.fvp import builder as lbd_short_fvp_builder
-from nacc.ftld.ivp import builder as ftld_ivp_builder
-from nacc.ftld.fvp import builder as ftld_fvp_builder
-from nacc.csf import builder as csf_builder
-from nacc.cv import builder as cv_builder
+from nacc.uds3 import clsform
+from nacc.uds3 import columns
 from nacc.uds3 import filters
 from nacc.uds3 import packet as uds3_packet
+from nacc.uds3 import schema
 from nacc.uds3 import Field
 
 
+# Modules that know how to turn a family's blanking rule text into a function
+BLANKS_MODULES = {
+    'uds3': blanks_uds3,
+    'lbd': blanks_lbd,
+    'ftld': blanks_ftld,
+    'csf': blanks_csf,
+    'cv': blanks_cv,
+}
+
+# Compiled blanking rules keyed by (packet family, field name, rule text)
+_compiled_blanking_rules: typing.Dict[typing.Tuple[str, str, str],
+                                      typing.Callable] = dict()
+
+
+def compile_blanking_rule(family: str, name: str, rule: str) \
+        -> typing.Callable:
+    """
+    Returns the compiled function for a blanking rule, building it only the
+    first time a given (family, field, rule) is seen. Rules are parsed when
+    their forms are generated, so the rule text is only parsed here if it
+    was not (see nacc.uds3.schema.rule_entry).
+    """
+    key = (family, name, rule)
+    compiled = _compiled_blanking_rules.get(key)
+    if compiled is None:
+        compiled = BLANKS_MODULES[family].compile_rule(
+            name, rule, _blanking_rule_entry(family, name, rule))
+        _compiled_blanking_rules[key] = compiled
+    return compiled
+
+
+def _blanking_rule_entry(family, name, rule):
+    entry = schema.rule_entry(family, name, rule)
+    if entry is None:
+        entry = BLANKS_MODULES[family].parse_rule(name, rule)
+    return entry
+
+
+class _BlankingIndex(object):
+    """
+    The blanking rules of a form, indexed by the condition that triggers
+    them.
+
+    Most rules only depend on a controlling field, and many fields share the
+    same condition (every "Blank if Question 8 HISPANIC ne 1 (Yes)"), so each
+    condition is evaluated once per packet and only the fields of the rules
+    it triggers are checked for a value.
+    """
+
+    def __init__(self, fields, families):
+        self.size = len(fields)
+        # the compiled rule of each condition (see check_blanks_batch)
+        self.entries = dict()
+        conditions = collections.OrderedDict()
+        # the order of each rule in the form, to report them in that order
+        order = 0
+        for key, field in fields.items():
+            for rule in field.blanks:
+                for family in families:
+                    entry = _blanking_rule_entry(family, field.name, rule)
+                    if entry[0] == 'special':
+                        # special cases are written for the field
+                        condition = (family, field.name, rule)
+                    else:
+                        condition = (family,) + tuple(entry)
+                    if condition not in conditions:
+                        self.entries[condition] = entry
+                        conditions[condition] = (
+                            compile_blanking_rule(family, field.name, rule),
+                            [])
+                    conditions[condition][1].append((order, key, rule))
+                    order += 1
+        self.conditions = tuple(
+            (condition, predicate, tuple(dependents))
+            for condition, (predicate, dependents) in conditions.items())
+
+
+# Marks a condition that was not evaluated yet (see check_blanks)
+_MISSING = object()
+
+# Blanking indexes keyed by (form class, families)
+_blanking_indexes: typing.Dict[typing.Tuple[type, typing.Tuple[str, ...]],
+                               _BlankingIndex] = dict()
+
+
+def _blanking_index(form, families) -> _BlankingIndex:
+    """
+    Returns the blanking index of the form's class, building it the first
+    time. Like FieldBag's layouts, it is only built again if an instance's
+    fields were changed.
+    """
+    key = (form.__class__, families)
+    index = _blanking_indexes.get(key)
+    if index is None or index.size != len(form.fields):
+        index = _BlankingIndex(form.fields, families)
+        _blanking_indexes[key] = index
+    return index
+
+
+def blanking_rule_families(options: argparse.Namespace) -> typing.List[str]:
+    """ Returns the families whose blanking rules apply to the options """
+    families = []
+    if not options.lbd and not options.ftld and not options.csf \
+       and not options.cv:
+        families.append('uds3')
+    if options.lbd:
+        families.append('lbd')
+    if options.ftld:
+        families.append('ftld')
+    if options.csf:
+        families.append('csf')
+    if options.cv:
+        families.append('cv')
+    return families
+
+
 def check_blanks(packet: uds3_packet.Packet, options: argparse.Namespace) \
         -> typing.List:
     """
-    Parses rules for when each field should be blank and then checks them
+    Checks the rules for when each field should be blank, returning a
+    warning for each field that is not blank when a rule says it should be
     """
     warnings: list = []
+    families = tuple(blanking_rule_families(options))
+    # Whether each condition holds for the packet, or the exception checking
+    # it raised. That is only raised if a field depending on it has a value,
+    # as the field's rules are not checked otherwise.
+    triggered = dict()
 
     for form in packet:
-        # Find all fields that:
-        #   1) have blanking rules; and
-        #   2) aren't blank.
-        formid = ""
-        try:
-            formid = " in form %s" % (form.fields['FORMID'].value)
-        except KeyError:
-            pass
-        for field in [f for f in form.fields.values()
-                      if f.blanks and not empty(f)]:
+        formid = _formid(form)
+        fields = form.fields
+        found = []
+        for condition, predicate, dependents in \
+                _blanking_index(form, families).conditions:
+            # the predicate is evaluated outside of a handler, so that the
+            # exception it raises is not chained to a KeyError when re-raised
+            holds = triggered.get(condition, _MISSING)
+            if holds is _MISSING:
+                try:
+                    holds = bool(predicate(packet))
+                except Exception as e:
+                    holds = e
+                triggered[condition] = holds
 
-            for rule in field.blanks:
-                if not options.lbd and not options.ftld and not options.csf \
-                   and not options.cv:
-                    r = blanks_uds3.convert_rule_to_python(field.name, rule)
-                    if r(packet):
-                        blank_warnings(warnings, field.name, formid,
-                                       field.value, len(field.value), rule)
-
-                if options.lbd:
-                    t = blanks_lbd.convert_rule_to_python(field.name, rule)
-                    if t(packet):
-                        blank_warnings(warnings, field.name, formid,
-                                       field.value, len(field.value), rule)
-
-                if options.ftld:
-                    s = blanks_ftld.convert_rule_to_python(field.name, rule)
-                    if s(packet):
-                        blank_warnings(warnings, field.name, formid,
-                                       field.value, len(field.value), rule)
-
-                if options.csf:
-                    q = blanks_csf.convert_rule_to_python(field.name, rule)
-                    if q(packet):
-                        blank_warnings(warnings, field.name, formid,
-                                       field.value, len(field.value), rule)
-
-                if options.cv:
-                    u = blanks_cv.convert_rule_to_python(field.name, rule)
-                    if u(packet):
-                        blank_warnings(warnings, field.name, formid,
-                                       field.value, len(field.value), rule)
+            if holds is False:
+                continue
+            for order, key, rule in dependents:
+                field = fields[key]
+                if not empty(field):
+                    found.append((order, field, rule, holds))
+
+        found.sort(key=lambda f: f[0])
+        for order, field, rule, holds in found:
+            if holds is not True:
+                raise holds
+            blank_warnings(warnings, field.name, formid, field.value,
+                           len(field.value), rule)
     return warnings
 
 
+def check_blanks_batch(packets: typing.List[uds3_packet.Packet],
+                       options: argparse.Namespace) -> typing.List:
+    """
+    Checks the blanking rules of a block of packets at once, returning for
+    each packet the warnings check_blanks would, or the exception it would
+    raise.
+
+    Each condition is evaluated for every packet at once as a mask (see
+    nacc.uds3.batch.blanking_mask), and only the fields of the packets it
+    holds for are checked for a value. Special cases, which are written in
+    code, are still evaluated one packet at a time.
+    """
+    from nacc.uds3 import batch
+
+    families = tuple(blanking_rule_families(options))
+    # Whether each condition holds for each packet, along with the exception
+    # checking it raised for some packets (see check_blanks)
+    triggered = dict()
+    found: list = [[] for _ in packets]
+    # The values of the fields conditions depend on, as many share a field
+    columns = dict()
+
+    def column(packets, key):
+        if key not in columns:
+            columns[key] = batch.field_column(packets, key)
+        return columns[key]
+
+    # The forms of the block, by their blanking index
+    forms = collections.OrderedDict()
+    for p, packet in enumerate(packets):
+        for position, form in enumerate(packet):
+            forms.setdefault(_blanking_index(form, families), []).append(
+                (p, position, form))
+
+    for index, instances in forms.items():
+        rows = [p for p, position, form in instances]
+        for condition, predicate, dependents in index.conditions:
+            state = triggered.get(condition)
+            if state is None:
+                state = batch.condition_mask(
+                    packets, index.entries[condition], predicate, column)
+                triggered[condition] = state
+            holds, errors = state
+
+            selected = [instance for instance, hit in
+                        zip(instances, holds[rows].tolist())
+                        if hit or instance[0] in errors]
+            for order, key, rule in dependents:
+                fields = [form.fields[key] for p, position, form in selected]
+                filled = ~batch.empty_mask([
+                    None if field.val is None else str(field.val)
+                    for field in fields])
+                for i in filled.nonzero()[0]:
+                    p, position, form = selected[i]
+                    found[p].append((position, order, form, fields[i], rule,
+                                 errors.get(p, True)))
+
+    results = []
+    for packet_found in found:
+        warnings = []
+        formids = dict()
+        packet_found.sort(key=lambda f: f[:2])
+        for position, order, form, field, rule, holds in packet_found:
+            if holds is not True:
+                warnings = holds
+                break
+            if position not in formids:
+                formids[position] = _formid(form)
+            value = field.value
+            blank_warnings(warnings, field.name, formids[position], value,
+                           len(value), rule)
+        results.append(warnings)
+    return results
+
+
+def _formid(form):
+    """ Returns the " in form <FORMID>" part of a form's warnings """
+    field = form.fields.get('FORMID')
+    return "" if field is None else " in form %s" % (field.value)
+
+
 def blank_warnings(warnings, fieldname, formid, value, length, rule):
     warnings.append(
         "%s%s is '%s' with length '%s', but should be blank: '%s'." %
@@ -396,99 +582,415 @@ def set_blanks_to_zero(packet):
         pass
 
 
-def convert(fp, options, out=sys.stdout, err=sys.stderr):
-    """Converts data in REDCap's CSV format to NACC's fixed-width format."""
-    reader = csv.DictReader(fp)
-    for record in reader:
-        # Right now the csf form is a single non-longitudinal form in a
-        # separate REDCap project with no redcap_event_name.
-        if not options.csf:
-            event_match = check_redcap_event(options, record)
-            if not event_match:
-                continue
+# Builder for each packet type, checked in order against the options: the
+# flags that must all be set, the builder module, the name of its build
+# function and whether that function accepts the error stream. The modules
+# (and the large forms modules they use) are only imported when used.
+class Builder(collections.namedtuple(
+        'Builder', ['flags', 'module', 'function', 'takes_err'])):
+    __slots__ = ()
+
+    def load(self):
+        """ Returns the build function, importing its module """
+        return getattr(importlib.import_module(self.module), self.function)
+
+
+BUILDERS = [
+    Builder(('lbd', 'ivp'), 'nacc.lbd.ivp.builder', 'build_lbd_ivp_form',
+            False),
+    Builder(('lbd', 'fvp'), 'nacc.lbd.fvp.builder', 'build_lbd_fvp_form',
+            False),
+    Builder(('lbdsv', 'ivp'), 'nacc.lbd.v3_1.ivp.builder',
+            'build_lbd_short_ivp_form', False),
+    Builder(('lbdsv', 'fvp'), 'nacc.lbd.v3_1.fvp.builder',
+            'build_lbd_short_fvp_form', False),
+    Builder(('ftld', 'ivp'), 'nacc.ftld.ivp.builder', 'build_ftld_ivp_form',
+            True),
+    Builder(('ftld', 'fvp'), 'nacc.ftld.fvp.builder', 'build_ftld_fvp_form',
+            True),
+    Builder(('csf',), 'nacc.csf.builder', 'build_csf_form', False),
+    Builder(('cv',), 'nacc.cv.builder', 'build_cv_form', True),
+    Builder(('ivp',), 'nacc.uds3.ivp.builder', 'build_uds3_ivp_form', True),
+    Builder(('np',), 'nacc.uds3.np.builder', 'build_uds3_np_form', False),
+    Builder(('fvp',), 'nacc.uds3.fvp.builder', 'build_uds3_fvp_form', True),
+    Builder(('tfp',), 'nacc.uds3.tfp.v3_2.builder',
+            'build_uds3_tfp_new_form', True),
+    Builder(('tfp3',), 'nacc.uds3.tfp.builder', 'build_uds3_tfp_form',
+            False),
+    Builder(('m',), 'nacc.uds3.m.builder', 'build_uds3_m_form', False),
+]
+
+
+def select_builder(options) -> typing.Optional[Builder]:
+    """ Returns the first builder whose flags are all set in options """
+    for builder in BUILDERS:
+        if all(getattr(options, flag) for flag in builder.flags):
+            return builder
+    return None
+
+
+def build_packet(record, options, err=sys.stderr):
+    """ Builds the packet for `record` using the builder selected by options """
+    builder = select_builder(options)
+    if builder is None:
+        raise ValueError("No packet type selected by the options")
+
+    build = builder.load()
+    if builder.takes_err:
+        return build(record, err)
+    return build(record)
+
+
+@functools.lru_cache(maxsize=None)
+def _builder_columns(module) -> columns.Columns:
+    return columns.redcap_columns(importlib.import_module(module), clsform,
+                                  check_redcap_event)
+
+
+def redcap_columns_for(options) -> typing.Optional[columns.Columns]:
+    """
+    Returns the REDCap columns that converting with options may read, or
+    None if no builder is selected.
+    """
+    builder = select_builder(options)
+    if builder is None:
+        return None
+    return _builder_columns(builder.module)
 
-        print("[START] ptid : " + str(record['ptid']), file=err)
-        try:
-            if options.lbd and options.ivp:
-                packet = lbd_ivp_builder.build_lbd_ivp_form(record)
-            elif options.lbd and options.fvp:
-                packet = lbd_fvp_builder.build_lbd_fvp_form(record)
-            elif options.lbdsv and options.ivp:
-                packet = lbd_short_ivp_builder.build_lbd_short_ivp_form(record)
-            elif options.lbdsv and options.fvp:
-                packet = lbd_short_fvp_builder.build_lbd_short_fvp_form(record)
-            elif options.ftld and options.ivp:
-                packet = ftld_ivp_builder.build_ftld_ivp_form(record)
-            elif options.ftld and options.fvp:
-                packet = ftld_fvp_builder.build_ftld_fvp_form(record)
-            elif options.csf:
-                packet = csf_builder.build_csf_form(record)
-            elif options.cv:
-                packet = cv_builder.build_cv_form(record)
-            elif options.ivp:
-                packet = ivp_builder.build_uds3_ivp_form(record)
-            elif options.np:
-                packet = np_builder.build_uds3_np_form(record)
-            elif options.fvp:
-                packet = fvp_builder.build_uds3_fvp_form(record)
-            elif options.tfp:
-                packet = tfp_new_builder.build_uds3_tfp_new_form(record)
-            elif options.tfp3:
-                packet = tfp_builder.build_uds3_tfp_form(record)
-            elif options.m:
-                packet = m_builder.build_uds3_m_form(record)
-
-        except Exception:
-            if 'ptid' in record:
-                print("[SKIP] Error for ptid : " + str(record['ptid']),
-                      file=err)
-            traceback.print_exc()
-            continue
 
-        if not (options.np or options.m or options.lbd or options.lbdsv or
-                options.ftld or options.csf or options.cv):
-            set_blanks_to_zero(packet)
+def packet_type_columns(names) -> columns.Columns:
+    """
+    Returns the REDCap columns that converting the named packet types (see
+    ALL_PACKET_TYPES, or tfp3 and csf) may read
+    """
+    flags = dict(ALL_PACKET_TYPES, tfp3=['-tfp3'], csf=['-csf'])
+    wanted = columns.Columns(columns.BASE_COLUMNS, frozenset())
+    for name in names:
+        if name not in flags:
+            raise ValueError('Unknown packet type "%s", expected one of: %s'
+                             % (name, ', '.join(flags)))
+        wanted |= redcap_columns_for(parse_args(flags[name]))
+    return wanted
+
+
+def read_records(fp, wanted: typing.Optional[columns.Columns]):
+    """ Reads the REDCap CSV, keeping only the wanted columns of each row """
+    if wanted is None:
+        return csv.DictReader(fp)
+    return columns.projected_reader(fp, wanted)
+
+
+def convert_record(record, options, out=sys.stdout, err=sys.stderr,
+                   check_event=True):
+    """Converts a single REDCap record to NACC's fixed-width format."""
+    packet = _prepare_packet(record, options, err, check_event)
+    if packet is None:
+        return
+
+    try:
+        blanks = check_blanks(packet, options)
+    except KeyError as e:
+        blanks = e
+    _finish_packet(record, packet, options, blanks, out, err)
 
-        if options.m or options.tfp:
-            blanks_uds3.set_zeros_to_blanks(packet)
 
-        warnings = []
+def convert_records(records, options, out=sys.stdout, err=sys.stderr):
+    """
+    Converts a block of REDCap records like convert_record does, but checks
+    the blanking rules of their packets all at once (see check_blanks_batch)
+    """
+    block = []
+    for record in records:
+        # the diagnostics are written in the order of the records
+        record_err = io.StringIO()
+        packet = _prepare_packet(record, options, record_err, True)
+        block.append((record, packet, record_err))
+
+    results = iter(check_blanks_batch(
+        [packet for _, packet, _ in block if packet is not None], options))
+    for record, packet, record_err in block:
+        err.write(record_err.getvalue())
+        if packet is not None:
+            _finish_packet(record, packet, options, next(results), out, err)
+
+
+def _prepare_packet(record, options, err, check_event):
+    """
+    Returns the packet built for the record, ready for its blanking rules to
+    be checked, or None if the record is not converted
+    """
+    # Right now the csf form is a single non-longitudinal form in a
+    # separate REDCap project with no redcap_event_name.
+    if not options.csf and check_event:
+        event_match = check_redcap_event(options, record, err=err)
+        if not event_match:
+            return None
+
+    print("[START] ptid : " + str(record['ptid']), file=err)
+    try:
+        packet = build_packet(record, options, err)
+    except Exception:
+        if 'ptid' in record:
+            print("[SKIP] Error for ptid : " + str(record['ptid']),
+                  file=err)
+        traceback.print_exc(file=err)
+        return None
+
+    if not (options.np or options.m or options.lbd or options.lbdsv or
+            options.ftld or options.csf or options.cv):
+        set_blanks_to_zero(packet)
+
+    if options.m or options.tfp:
+        blanks_uds3.set_zeros_to_blanks(packet)
+    return packet
+
+
+def _finish_packet(record, packet, options, blanks, out, err):
+    """
+    Writes the packet, unless it has warnings. `blanks` are the warnings of
+    its blanking rules, or the exception checking them raised.
+    """
+    if isinstance(blanks, Exception):
+        if not isinstance(blanks, KeyError):
+            raise blanks
+        print("[SKIP] Error for ptid : " + str(record['ptid']), file=err)
+        traceback.print_exception(type(blanks), blanks, blanks.__traceback__,
+                                  file=err)
+        return
+
+    warnings = list(blanks)
+    try:
+        warnings += check_characters(packet)
+    except KeyError:
+        print("[SKIP] Error for ptid : " + str(record['ptid']), file=err)
+        traceback.print_exc(file=err)
+        return
+
+    if warnings:
+        print("[SKIP] Error for ptid : " + str(record['ptid']),
+              file=err)
+        warn = "\n".join(map(str, warnings))
+        warn = warn.replace("\\", "")
+        print(warn, file=err)
+        return
+
+    if not options.np and not options.m and not options.lbd and not \
+       options.lbdsv and not options.ftld and not options.csf and not \
+       options.cv:
+        warnings += check_single_select(packet)
+
+    for form in packet:
+
         try:
-            warnings += check_blanks(packet, options)
-        except KeyError:
-            print("[SKIP] Error for ptid : " + str(record['ptid']), file=err)
-            traceback.print_exc()
+            print(form, file=out)
+        except AssertionError:
+            print("[SKIP] Error for ptid : " + str(record['ptid']),
+                  file=err)
+            traceback.print_exc(file=err)
             continue
 
+
+# Packet types converted by --all: the name of each output file and the flags
+# that select the packet type. TFP v3.0 and CSF are left out since they come
+# from older or separate REDCap projects.
+ALL_PACKET_TYPES = [
+    ('ivp', ['-ivp']),
+    ('fvp', ['-fvp']),
+    ('tfp', ['-tfp']),
+    ('np', ['-np']),
+    ('m', ['-m']),
+    ('cv', ['-cv']),
+    ('lbd_ivp', ['-lbd', '-ivp']),
+    ('lbd_fvp', ['-lbd', '-fvp']),
+    ('lbdsv_ivp', ['-lbdsv', '-ivp']),
+    ('lbdsv_fvp', ['-lbdsv', '-fvp']),
+    ('ftld_ivp', ['-ftld', '-ivp']),
+    ('ftld_fvp', ['-ftld', '-fvp']),
+]
+
+
+def all_packet_types() -> typing.List[typing.Tuple[str, argparse.Namespace]]:
+    """ Returns the name and options of each packet type converted by --all """
+    return [(name, parse_args(flags)) for name, flags in ALL_PACKET_TYPES]
+
+
+def convert_record_all(record, packet_types, outs, err=sys.stderr):
+    """
+    Converts a single REDCap record for every packet type whose event and
+    forms it matches, writing each packet type to its own output.
+    """
+    for name, options in packet_types:
         try:
-            warnings += check_characters(packet)
+            event_match = check_redcap_event(options, record, err=err)
         except KeyError:
-            print("[SKIP] Error for ptid : " + str(record['ptid']), file=err)
-            traceback.print_exc()
+            # The project does not have the forms for this packet type.
             continue
+        if event_match:
+            convert_record(record, options, outs[name], err,
+                           check_event=False)
 
-        if warnings:
-            print("[SKIP] Error for ptid : " + str(record['ptid']),
-                  file=err)
-            warn = "\n".join(map(str, warnings))
-            warn = warn.replace("\\", "")
-            print(warn, file=err)
-            continue
 
-        if not options.np and not options.m and not options.lbd and not \
-           options.lbdsv and not options.ftld and not options.csf and not \
-           options.cv:
-            warnings += check_single_select(packet)
+# Number of records handed to a worker process at a time when using --jobs
+JOBS_CHUNKSIZE = 16
 
-        for form in packet:
+# Number of records converted at a time with -batch
+BATCH_SIZE = 256
+
+# Options (or packet types, with --all) and cache of the run, set once in
+# each worker process by _init_worker
+_worker_options = None
+_worker_cache = None
+
+
+def _init_worker(options, cache=None):
+    global _worker_options, _worker_cache
+    _worker_options = options
+    _worker_cache = cache
+
+
+def _cached(cache, record, convert):
+    """
+    Returns the cached result of converting the record, calling convert to
+    get it (and caching it) if there is none
+    """
+    if cache is None:
+        return convert(record)
+    key = cache.key(record)
+    result = cache.get(key)
+    if result is None:
+        result = convert(record)
+        cache.put(key, result)
+    return result
+
+
+def convert_record_buffered(record, options):
+    """
+    Converts a record, returning what would have been written to the output
+    and error streams, so it can be written in the original record order or
+    cached.
+    """
+    out = io.StringIO()
+    err = io.StringIO()
+    convert_record(record, options, out, err)
+    return out.getvalue(), err.getvalue()
 
-            try:
-                print(form, file=out)
-            except AssertionError:
-                print("[SKIP] Error for ptid : " + str(record['ptid']),
-                      file=err)
-                traceback.print_exc()
-                continue
+
+def convert_record_all_buffered(record, packet_types):
+    """ Same as convert_record_buffered, but for every packet type """
+    outs = collections.defaultdict(io.StringIO)
+    err = io.StringIO()
+    convert_record_all(record, packet_types, outs, err)
+    return {name: out.getvalue() for name, out in outs.items()}, \
+        err.getvalue()
+
+
+def _convert_record_buffered(record):
+    """ Converts a record in a worker process """
+    return _cached(_worker_cache, record,
+                   lambda r: convert_record_buffered(r, _worker_options))
+
+
+def _convert_record_all_buffered(record):
+    """ Converts a record for every packet type in a worker process """
+    return _cached(_worker_cache, record,
+                   lambda r: convert_record_all_buffered(r, _worker_options))
+
+
+def conversion_mode(options) -> typing.List[str]:
+    """ Returns the flags of options that select how records are converted """
+    return sorted(flag for flag in ('ivp', 'fvp', 'tfp', 'tfp3', 'np', 'm',
+                                    'lbd', 'lbdsv', 'ftld', 'csf', 'cv')
+                  if getattr(options, flag))
+
+
+def convert(fp, options, out=sys.stdout, err=sys.stderr, jobs=1,
+            cache_dir=None):
+    """
+    Converts data in REDCap's CSV format to NACC's fixed-width format.
+
+    With `cache_dir`, the output of each record is cached there, and records
+    whose columns have not changed since are not converted again.
+
+    With `options.batch`, the records are converted BATCH_SIZE at a time (see
+    convert_records), unless they are converted by several processes or
+    cached.
+    """
+    records = read_records(fp, redcap_columns_for(options))
+    cache = None
+    if cache_dir:
+        cache = conversion_cache.ConversionCache(
+            cache_dir, conversion_mode(options))
+
+    if jobs > 1:
+        with multiprocessing.Pool(
+                jobs, _init_worker, (options, cache)) as pool:
+            results = pool.imap(_convert_record_buffered, records,
+                                chunksize=JOBS_CHUNKSIZE)
+            for record_out, record_err in results:
+                out.write(record_out)
+                err.write(record_err)
+    elif cache:
+        for record in records:
+            record_out, record_err = _cached(
+                cache, record, lambda r: convert_record_buffered(r, options))
+            out.write(record_out)
+            err.write(record_err)
+    elif options.batch:
+        while True:
+            block = list(itertools.islice(records, BATCH_SIZE))
+            if not block:
+                break
+            convert_records(block, options, out, err)
+    else:
+        for record in records:
+            convert_record(record, options, out, err)
+
+
+def convert_all(fp, outdir, err=sys.stderr, jobs=1, cache_dir=None):
+    """
+    Converts every packet type in a single pass over REDCap's CSV, writing
+    each packet type to "<outdir>/<name>.txt" (see ALL_PACKET_TYPES).
+    `cache_dir` is the same as for convert.
+    """
+    packet_types = all_packet_types()
+    cache = None
+    if cache_dir:
+        cache = conversion_cache.ConversionCache(cache_dir, ['all'])
+
+    outs = dict()
+    try:
+        for name, _ in packet_types:
+            outs[name] = open(os.path.join(outdir, name + '.txt'), 'w')
+
+        wanted = None
+        for _, options in packet_types:
+            builder_columns = redcap_columns_for(options)
+            wanted = builder_columns if wanted is None \
+                else wanted | builder_columns
+        reader = read_records(fp, wanted)
+        if jobs > 1:
+            with multiprocessing.Pool(
+                    jobs, _init_worker, (packet_types, cache)) as pool:
+                results = pool.imap(_convert_record_all_buffered, reader,
+                                    chunksize=JOBS_CHUNKSIZE)
+                for record_outs, record_err in results:
+                    for name, text in record_outs.items():
+                        outs[name].write(text)
+                    err.write(record_err)
+        elif cache:
+            for record in reader:
+                record_outs, record_err = _cached(
+                    cache, record,
+                    lambda r: convert_record_all_buffered(r, packet_types))
+                for name, text in record_outs.items():
+                    outs[name].write(text)
+                err.write(record_err)
+        else:
+            for record in reader:
+                convert_record_all(record, packet_types, outs, err)
+    finally:
+        for out in outs.values():
+            out.close()
 
 
 filters_names = {
@@ -525,6 +1027,10 @@ def parse_args(args=None):
     option_group.add_argument(
         '-m', action='store_true', dest='m',
         help='Set this flag to process as m data')
+    option_group.add_argument(
+        '--all', action='store_true', dest='all',
+        help='Set this flag to process every packet type in one pass, writing'
+        ' each to its own file in -outdir')
     option_group.add_argument(
         '-f', '--filter', action='store', dest='filter',
         choices=list(filters_names.keys()),
@@ -546,9 +1052,23 @@ def parse_args(args=None):
     parser.add_argument(
         '-cv', action='store_true', dest='cv',
         help='Set this flag to process as COVID-19 data')
+    parser.add_argument(
+        '-j', '--jobs', action='store', dest='jobs', type=int, default=1,
+        help='Number of processes to convert records with (default: 1)')
     parser.add_argument(
         '-file', action='store', dest='file',
         help='Path of the csv file to be processed.')
+    parser.add_argument(
+        '-outdir', action='store', dest='outdir', default='.',
+        help='Directory to write the output files to (in case --all is used)')
+    parser.add_argument(
+        '-cache', action='store', dest='cache_dir',
+        help='Directory to cache the output of each record in; records that'
+        ' have not changed since are not converted again')
+    parser.add_argument(
+        '-batch', action='store_true', dest='batch',
+        help='Set this flag to check the blanking rules of blocks of records'
+        ' at once with NumPy (requires numpy)')
     parser.add_argument(
         '-meta', action='store', dest='filter_meta',
         help='Input file for the filter metadata (in case -filter is used)')
@@ -561,13 +1081,25 @@ def parse_args(args=None):
     parser.add_argument(
         '-vtype', action='store', dest='vtype',
         help='Ptid for which you need the records')
+    parser.add_argument(
+        '-index', action='store_true', dest='index',
+        help='Set this flag to look up getPtid records with an index kept'
+        ' next to -file, which is built the first time and whenever the file'
+        ' changes')
 
     options = parser.parse_args(args)
+    if options.index and not options.file:
+        parser.error('-index requires -file')
+    if options.batch:
+        # NumPy is only imported when records are checked in blocks
+        from nacc.uds3 import batch
+        if not batch.available():
+            parser.error('-batch requires numpy')
     # Defaults to processing of ivp.
     # TODO this can be changed in future to process fvp by default.
     if not (options.ivp or options.fvp or options.tfp or options.tfp3 or
             options.np or options.m or options.csf or options.cv or
-            options.filter):
+            options.filter or options.all):
         options.ivp = True
 
     return options
@@ -585,15 +1117,22 @@ def main():
     output = sys.stdout
 
     if options.filter:
-        if options.filter == "getPtid":
+        if options.filter == "getPtid" and options.index:
+            filters.filter_extract_ptid_indexed(
+                options.file, options.ptid, options.vnum, options.vtype,
+                output)
+        elif options.filter == "getPtid":
             filters.filter_extract_ptid(
                 fp, options.ptid, options.vnum, options.vtype, output)
         else:
             filter_method = 'filter_' + filters_names[options.filter]
             filter_func = getattr(filters, filter_method)
             filter_func(fp, options.filter_meta, output)
+    elif options.all:
+        convert_all(fp, options.outdir, jobs=options.jobs,
+                    cache_dir=options.cache_dir)
     else:
-        convert(fp, options)
+        convert(fp, options, jobs=options.jobs, cache_dir=options.cache_dir)
 
 
 if __name__ == '__main__':
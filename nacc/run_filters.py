@@ -1,9 +1,15 @@
+import argparse
+import contextlib
 import os
 import sys
 import csv
 import datetime
 import configparser
 from redcap import Project
+from nacc import export
+from nacc import redcap2nacc
+from nacc.uds3 import columns
+from nacc.uds3 import filters
 from nacc.uds3.filters import *
 
 
@@ -23,57 +29,29 @@ def get_headers(input_ptr):
     print(headers)
 
 
-def run_all_filters(folder_name, config):
-    # Calling Filters
+def run_all_filters(folder_name, config, debug=False):
+    """
+    Runs every filter over redcap_input.csv into final_Update.csv in one pass.
+    With `debug`, the output of each filter is also kept in its own file.
+    """
     try:
-        print("--------------Removing subjects already in current--------------------", file=sys.stderr)
         input_path = os.path.join(folder_name, "redcap_input.csv")
-        output_path = os.path.join(folder_name, "clean.csv")
-        print("Processing", file=sys.stderr)
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_clean_ptid(input_ptr, config, output_ptr)
-
-        print("--------------Replacing drug IDs--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "clean.csv")
-        output_path = os.path.join(folder_name, "drugs.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_replace_drug_id(input_ptr, config, output_ptr)
-
-        print("--------------Fixing Headers--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "drugs.csv")
-        output_path = os.path.join(folder_name, "clean_headers.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_fix_headers(input_ptr, config, output_ptr)
-
-        print("--------------Filling in Defaults--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "clean_headers.csv")
-        output_path = os.path.join(folder_name, "default.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_fill_default(input_ptr, config, output_ptr)
-
-        print("--------------Updating fields--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "default.csv")
-        output_path = os.path.join(folder_name, "update_fields.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_update_field(input_ptr, config, output_ptr)
-
-        print("--------------Fixing Visit Dates--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "update_fields.csv")
-        output_path = os.path.join(folder_name, "proper_visitdate.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_fix_visitdate(input_ptr, config, output_ptr)
-
-        print("--------------Removing Unnecessary Records--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "proper_visitdate.csv")
-        output_path = os.path.join(folder_name, "CleanedPtid_Update.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_remove_ptid(input_ptr, config, output_ptr)
-
-        print("--------------Removing Records without VisitDate--------------------", file=sys.stderr)
-        input_path = os.path.join(folder_name, "CleanedPtid_Update.csv")
         output_path = os.path.join(folder_name, "final_Update.csv")
-        with open(output_path, 'w') as output_ptr, open(input_path, 'r') as input_ptr:
-            filter_eliminate_empty_date(input_ptr, config, output_ptr)
+        with contextlib.ExitStack() as files:
+            stages = []
+            for description, intermediate, stage in filter_stages(config):
+                if debug:
+                    intermediate_ptr = files.enter_context(
+                        open(os.path.join(folder_name, intermediate), 'w'))
+                    stage = tee_stage(stage, intermediate_ptr)
+                # the stages run together, so each header is printed when
+                # its stage gets the first record
+                stages.append(announce_stage(stage, description))
+
+            print("Processing", file=sys.stderr)
+            input_ptr = files.enter_context(open(input_path, 'r'))
+            output_ptr = files.enter_context(open(output_path, 'w'))
+            run_stages(input_ptr, output_ptr, stages)
 
     except Exception as e:
         print("Error in Opening a file")
@@ -88,6 +66,27 @@ def read_config(config_path):
     return config
 
 
+def wanted_columns(config):
+    """
+    Returns the REDCap columns that the filters and the builders of the
+    packet types listed in the config may read, or None if the config does
+    not list any (to export every field)
+    """
+    packet_types = config.get('pycap', 'packet_types', fallback='')
+    names = [name.strip() for name in packet_types.split(',') if name.strip()]
+    if not names:
+        return None
+
+    wanted = redcap2nacc.packet_type_columns(names) | \
+        columns.redcap_columns(filters)
+    # Columns that filter_fix_headers renames are exported by their old name
+    if config.has_section('filter_fix_headers'):
+        renamed = [old for old, new in config.items('filter_fix_headers')
+                   if new in wanted]
+        wanted |= columns.Columns(frozenset(renamed), frozenset())
+    return wanted
+
+
 def get_data_from_redcap_pycap(folder_name, config):
     # Enter the path for filters_config
     try:
@@ -112,41 +111,74 @@ def get_data_from_redcap_pycap(folder_name, config):
     header_full = list(set(header_a + header_b))
     header_full.insert(1, 'redcap_event_name')
 
-    # Get list of all records present in project to iterate over
-    list_of_records = []
-    all_records = redcap_project.export_records(fields=['ptid'])
-    for record in all_records:
-        if record['ptid'] not in list_of_records:
-            list_of_records.append(record['ptid'])
-
-    chunked_records = []
-    # Break the list into chunks of 50
-    n = 50
-    for i in range(0, len(list_of_records), n):
-        chunked_records.append(list_of_records[i:i + n])
+    # Only export the fields needed for the packet types in the config
+    fields = None
+    wanted = wanted_columns(config)
+    if wanted is not None:
+        fields, header_full = export.project_fields(
+            list_of_fields, redcap_project.forms, wanted)
+        header_full.insert(1, 'redcap_event_name')
 
+    # Get list of all records present in project to iterate over
+    list_of_records = export.unique_ptids(
+        redcap_project.export_records(fields=['ptid']))
+
+    # Chunks of 50 ptids are exported a few at a time and saved in the run
+    # folder, so running again after a failure only exports what is missing
+    def export_records(ptids):
+        return redcap_project.export_records(records=ptids, fields=fields)
+
+    # With a record store, only the records modified since the last run are
+    # exported after the first
+    store_path = config.get('pycap', 'record_store', fallback=None)
+    store = export.RecordStore(store_path) if store_path else None
+    workdir = os.path.join(folder_name, "redcap_export")
     try:
+        try:
+            if store:
+                records = export.export_with_store(
+                    export_records,
+                    lambda since: redcap_project.export_records(
+                        date_range_begin=since, fields=fields),
+                    list_of_records, workdir, store, fields=fields,
+                    chunk_size=50)
+            else:
+                records = export.export_in_chunks(
+                    export_records, list_of_records, workdir, chunk_size=50,
+                    fields=fields)
+        except export.ExportError as e:
+            print("Error in Exporting", file=sys.stderr)
+            print(e, file=sys.stderr)
+            raise e
 
         try:
             with open(os.path.join(folder_name, "redcap_input.csv"), "w") as redcap_export:
                 writer = csv.DictWriter(redcap_export, fieldnames=header_full)
                 writer.writeheader()
-                # header_mapping = next(reader)
-                for current_record_chunk in chunked_records:
-                    data = redcap_project.export_records(records=current_record_chunk)
-                    for row in data:
-                        writer.writerow(row)
+                writer.writerows(records)
         except Exception as e:
             print("Error in Writing")
             print(e)
-
-    except Exception:
-        print("Error in CSV file")
+    finally:
+        # the stored records are read while they are written
+        if store:
+            store.close()
 
     return
 
 
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        description='Export REDCap data and run it through the filters')
+    parser.add_argument('config_path', help='Path to nacculator_cfg.ini')
+    parser.add_argument('--debug', action='store_true',
+                        help='Also write the output of each filter to its '
+                        'own file in the run folder')
+    return parser.parse_args(args)
+
+
 def main():
+    options = parse_args()
     currentdate = datetime.datetime.now().strftime('%m-%d-%Y')
     folder_name = "run_" + currentdate
     print("Recent folder " + folder_name, file=sys.stderr)
@@ -158,11 +190,11 @@ def main():
         recent_run_folder(identified_folder)
 
 # Reading from Config and Accessing the necessary Data
-    config_path = sys.argv[1]
+    config_path = options.config_path
     config = read_config(config_path)
 
     get_data_from_redcap_pycap(folder_name, config)
-    run_all_filters(folder_name, config_path)
+    run_all_filters(folder_name, config_path, debug=options.debug)
 
     exit()
 
@@ -5,125 +5,310 @@
 ###############################################################################
 
 # nacc.uds3
+import collections
 import decimal
+import functools
 
 
 class _UdsType(object):
+    """
+    Converts a value to its canonical, space-padded string
+
+    Instances hold no state besides the length, so one instance can be shared
+    by every Field with the same type and length, even across threads.
+    """
+    __slots__ = ('length',)
+
     def __init__(self, length):
         assert length > 0
         self.length = length
 
-    def __call__(self, *args, **kwargs):
-        value = args[0] if len(args) > 0 else None
-        self.val = str(value if value is not None else "")
-        self.val = self.val.ljust(self.length, ' ')
-        return self.val
+    def __call__(self, value=None):
+        if value is None:
+            return "".ljust(self.length)
+        return str(value).ljust(self.length)
 
     def __eq__(self, other):
         return self.__class__ == other.__class__ and \
-               self.length == other.length and self.val == other.val
+               self.length == other.length
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.__class__, self.length))
 
 
 class Char(_UdsType):
-    pass
+    __slots__ = ()
 
 
 class Num(_UdsType):
-    def __call__(self, *args, **kwargs):
-        value = args[0] if len(args) > 0 else None
-        try:
-            # check to see if value is a number
-            if value is not None and value != "":
-                decimal.Decimal(value)
-            return super(Num, self).__call__(value)
-        except ValueError:
-            # just re-raise the error for now
-            raise
+    __slots__ = ()
+
+    def __call__(self, value=None):
+        # Nearly every value is a whole number, which needs no Decimal to
+        # check; anything else, like FORMVER "3.1", is checked by Decimal.
+        if value.__class__ is str:
+            if value.isdecimal() or value == "":
+                return value.ljust(self.length)
+        elif value.__class__ is int:
+            return str(value).ljust(self.length)
+        elif value is None:
+            return "".ljust(self.length)
+
+        # check to see if value is a number
+        decimal.Decimal(value)
+        return str(value).ljust(self.length)
 
 
 UDS3_TYPES = {'Num': Num, 'Char': Char}
 
 
+class FieldSpec(collections.namedtuple('FieldSpec', [
+        'name', 'typename', 'udstype', 'position', 'length',
+        'inclusive_range', 'allowable_values', 'blanks'])):
+    """
+    The parts of a Field that are the same in every instance of a form
+
+    Specs are immutable and shared by all the instances of a form class (see
+    FieldBag), so the allowable values are only canonicalized once.
+    """
+    __slots__ = ()
+
+    def __hash__(self):
+        # Specs are hashed for every value coerced (see _coerce) and a form's
+        # name and position are enough to tell its fields apart
+        return hash((self.name, self.position))
+
+    @classmethod
+    def create(cls, name, typename, position, length, inclusive_range=None,
+               allowable_values=None, blanks=None):
+        udstype = UDS3_TYPES[typename](length)
+        # get the canonical representation for allowable values, but filter
+        # out empty strings first
+        allowable = frozenset(udstype(v) for v in allowable_values or [] if v)
+        return cls(name, typename, udstype, position, length, inclusive_range,
+                   allowable, tuple(blanks or []))
+
+
 class Field(object):
+    __slots__ = ('spec', 'val')
+
     def __init__(self, name, typename, position, length, inclusive_range=None,
                  allowable_values=None, blanks=None, value=None):
         assert allowable_values is None or \
                allowable_values is not isinstance(allowable_values, str)
 
-        self.name = name
-        self.typename = typename
-        self.udstype = UDS3_TYPES[typename](length)
-        self.position = position
-        self.length = length
-        self.inclusive_range = inclusive_range
-        # get the canonical representation for allowable values, but filter out
-        # empty strings first
-        self.allowable_values = [self.udstype(v)
-                                 for v in [
-                                     _f for _f in allowable_values if _f]]
-        self.blanks = blanks or []
+        self.spec = FieldSpec.create(name, typename, position, length,
+                                     inclusive_range, allowable_values, blanks)
         self.val = value
 
+    @classmethod
+    def from_spec(cls, spec, value=None):
+        """ Returns a new Field sharing an existing spec """
+        field = cls.__new__(cls)
+        field.spec = spec
+        field.val = value
+        return field
+
+    @property
+    def name(self):
+        return self.spec.name
+
+    @property
+    def typename(self):
+        return self.spec.typename
+
+    @property
+    def udstype(self):
+        return self.spec.udstype
+
+    @property
+    def position(self):
+        return self.spec.position
+
+    @property
+    def length(self):
+        return self.spec.length
+
+    @property
+    def inclusive_range(self):
+        return self.spec.inclusive_range
+
+    @property
+    def allowable_values(self):
+        return self.spec.allowable_values
+
+    @property
+    def blanks(self):
+        return self.spec.blanks
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self.spec == other.spec and self.val == other.val
         else:
             return self.value == self.udstype(other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def within(self, low, high):
+        """
+        Returns True if the value is one of the whole numbers from low to high
+        (inclusive). Same as `self in range(low, high + 1)`, without comparing
+        the value to each number in the range.
+        """
+        text = self.value.rstrip(' ')
+        if not text.isdecimal():
+            return False
+        number = int(text)
+        return low <= number <= high and str(number) == text
+
     @property
     def value(self):
-        return self.udstype(self.val)
+        canonical = self._coerced(self.val)[0]
+        if isinstance(canonical, Exception):
+            raise _fresh(canonical)
+        return canonical
 
     @value.setter
     def value(self, val):
-        def out_of_range(v):
-            d = decimal.Decimal(v)
-            return d < int(self.inclusive_range[0]) or \
-                d > int(self.inclusive_range[1])
-
-        if self.allowable_values:
-            if val is None:
-                pass
-            elif isinstance(val, str) and str(val).strip() == "":
-                pass
-            else:
-                # val can be None, but if it isn't AND we are restricted to
-                # certain values, then we must check that the canonical form of
-                # val is in the allowable list
-                canonical = self.udstype(val)
-                if canonical not in self.allowable_values:
-                    if not isinstance(self.udstype, Num) or \
-                            out_of_range(canonical):
-                        raise ValueError('"%s" is either not a number or out'
-                                         ' of range for %s' % (val, self.name))
+        error = self._coerced(val)[1]
+        if error is not None:
+            raise _fresh(error)
+        self.val = val
 
+    def _coerced(self, val):
+        try:
+            return _coerce(self.spec, val)
+        except TypeError:
+            # unhashable values are not cached
+            return _coerce.__wrapped__(self.spec, val)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _coerce(spec, val):
+    """
+    Returns the canonical form of val for a field and the error assigning val
+    to the field would raise (None if it is valid). Either can be an
+    exception, which is returned rather than raised so that it is cached too.
+
+    REDCap values mostly come from a handful of codes like "", "0", "1" and
+    "88", so the results are cached per (spec, value) across all the Fields,
+    forms and records. See coercion_cache_info for the hit rate.
+    """
+    try:
+        canonical = spec.udstype(val)
+    except Exception as e:
+        canonical = e
+
+    try:
+        _validate(spec, val, canonical)
+        error = None
+    except Exception as e:
+        error = e
+
+    # drop the tracebacks so the cache does not keep their frames alive
+    for e in (canonical, error):
+        if isinstance(e, Exception):
+            e.with_traceback(None)
+    return canonical, error
+
+
+def _fresh(error):
+    """ Returns a copy of a cached exception to raise """
+    return error.__class__(*error.args)
+
+
+def _validate(spec, val, canonical):
+    def out_of_range(v):
+        # whole numbers are compared as ints, anything else as a Decimal
+        digits = v.strip(' ')
+        d = int(digits) if digits.isdecimal() else decimal.Decimal(v)
+        return d < int(spec.inclusive_range[0]) or \
+            d > int(spec.inclusive_range[1])
+
+    if val is None:
+        return
+    if isinstance(val, str) and str(val).strip() == "":
+        return
+    if not spec.allowable_values and isinstance(spec.udstype, Char):
+        return
+
+    if isinstance(canonical, Exception):
+        raise canonical
+
+    if spec.allowable_values:
+        # val can be None, but if it isn't AND we are restricted to certain
+        # values, then we must check that the canonical form of val is in the
+        # allowable list
+        if canonical not in spec.allowable_values:
+            if not isinstance(spec.udstype, Num) or out_of_range(canonical):
+                raise ValueError('"%s" is either not a number or out'
+                                 ' of range for %s' % (val, spec.name))
+    else:
+        # val can be None, but if it isn't, and we are NOT restricted to
+        # certain values (only an allowable range of values), then we need to
+        # check that the value is within that range
+        assert spec.inclusive_range
+        if out_of_range(canonical):
+            raise ValueError(
+                '"%s" is outside of the allowable range for %s : %s - %s' % (
+                    val, spec.name, spec.inclusive_range[0],
+                    spec.inclusive_range[1]))
+
+
+def coercion_cache_info():
+    """ Returns the hits and misses of the cache of canonical field values """
+    return _coerce.cache_info()
+
+
+def coercion_cache_clear():
+    _coerce.cache_clear()
+
+
+def _shared_schema(init):
+    """
+    Wraps a form's __init__ so it only runs for the first instance of the
+    form class. The Field specs it creates are kept as the class's schema and
+    later instances just get new Fields sharing those specs.
+    """
+    @functools.wraps(init)
+    def __init__(self):
+        cls = self.__class__
+        schema = cls.__dict__.get('_schema')
+        if schema is None:
+            init(self)
+            cls._schema = tuple((key, field.spec, field.val)
+                                for key, field in self.fields.items())
         else:
-            if val is None:
-                pass
-            elif isinstance(val, str) and str(val).strip() == "":
-                pass
-            elif isinstance(self.udstype, Char):
-                pass
-            else:
-                # val can be None, but if it isn't, and we are NOT restricted
-                # to certain values (only an allowable range of values),
-                # then we need to check that the value is within that range
-                canonical = self.udstype(val)
-                assert self.inclusive_range
-                if out_of_range(canonical):
-                    raise ValueError(
-                        '"%s" is outside of the allowable range for %s'
-                        ' : %s - %s' % (
-                            val, self.name, self.inclusive_range[0],
-                            self.inclusive_range[1]))
-        self.val = val
+            self.fields = {key: Field.from_spec(spec, val)
+                           for key, spec, val in schema}
+
+    return __init__
+
+
+class _Layout(object):
+    """ Fixed-width layout of a form: a blank record and each field's slice """
+    def __init__(self, fields):
+        last = max(fields.values(), key=lambda f: f.position[1])
+        self.template = bytes(' ' * last.position[1], 'ascii')
+        self.slices = tuple((name, f.position[0] - 1, f.position[1])
+                            for name, f in fields.items())
 
 
 class FieldBag(object):
     """ Base class for Forms """
+
+    # Layouts compiled by write, keyed by form class
+    _layouts = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super(FieldBag, cls).__init_subclass__(**kwargs)
+        if '__init__' in cls.__dict__:
+            cls.__init__ = _shared_schema(cls.__dict__['__init__'])
+
     def __init__(self):
         self.fields = dict()
 
@@ -163,26 +348,40 @@ class FieldBag(object):
     def form_name(self):
         return self.__class__.__name__.replace("Form", "")
 
+    def _layout(self):
+        """
+        Returns the layout of this form's class, compiling it the first time.
+
+        Every instance of a form class has the same fields, so the layout is
+        only compiled again if an instance's fields were changed.
+        """
+        layout = FieldBag._layouts.get(self.__class__)
+        if layout is None or len(layout.slices) != len(self.fields):
+            layout = _Layout(self.fields)
+            FieldBag._layouts[self.__class__] = layout
+        return layout
+
     def write(self, buf=None):
+        layout = self._layout()
         if buf is None:
-            last = max(list(self.fields.values()), key=lambda f: f.position[1])
-            buf = bytearray(' ' * last.position[1], 'ascii')
+            buf = bytearray(layout.template)
 
         orig_buf_size = len(buf)
 
-        for field in list(self.fields.values()):
-            value = field.value
-            start, end = field.position
-            formid = ''
-            try:
-                formid = ' in form %s' % (self.fields['FORMID'].value)
-            except KeyError:
-                pass
-            start -= 1
-            end -= 1
-            assert len(value) == end - start + 1, \
-                'Length of field %s%s with value "%s" is not valid. %s != %s' % (field.name, formid, value, len(value), end - start + 1)
-            buf[start:start + len(value)] = value.encode('ascii')
-
-        assert len(buf) == orig_buf_size, field.name + ": buffer changed size!"
+        fields = self.fields
+        for name, start, end in layout.slices:
+            value = fields[name].value
+            if len(value) != end - start:
+                formid = ''
+                try:
+                    formid = ' in form %s' % (fields['FORMID'].value)
+                except KeyError:
+                    pass
+                raise AssertionError(
+                    'Length of field %s%s with value "%s" is not valid.'
+                    ' %s != %s' % (name, formid, value, len(value),
+                                   end - start))
+            buf[start:end] = value.encode('ascii')
+
+        assert len(buf) == orig_buf_size, name + ": buffer changed size!"
         return buf.decode('ascii')
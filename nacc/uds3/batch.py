@@ -0,0 +1,151 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+# Checks the blanking rules of blocks of built packets at once with NumPy.
+#
+# Each rule's condition is evaluated over the values of the field it depends
+# on in every packet (see blanking_mask and condition_mask), rather than
+# once per packet.
+#
+# NumPy is optional: `available()` tells whether it is installed.
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Whole numbers with more digits than this could overflow an int64, and are
+# far outside the range of any blanking rule
+_MAX_DIGITS = 18
+
+
+def available() -> bool:
+    """ Returns True if NumPy is installed, so packets can be checked """
+    return numpy is not None
+
+
+def _by_distinct(items, function):
+    """
+    Returns the mask `function` gives for the distinct items (a list of them)
+    for each of the items. REDCap values mostly come from a few codes, so
+    each distinct one is only checked once.
+    """
+    distinct = list(dict.fromkeys(items))
+    mask = dict(zip(distinct, function(distinct).tolist()))
+    return numpy.fromiter(map(mask.__getitem__, items), dtype=bool,
+                          count=len(items))
+
+
+def blanking_mask(entry, values, lengths):
+    """
+    Returns whether the condition of a blanking rule holds for each value of
+    the field it depends on, or None if the rule can only be checked by its
+    function. `entry` is the rule compiled by parse_rule (see
+    nacc/uds3/blanks.py), `values` are the values the field was set to (a
+    str, or None for blank) and `lengths` the field's length for each.
+
+    The conditions are the same as the rule's function would give, which
+    compares the field's canonical (space padded) value.
+    """
+    kind = entry[0]
+    if kind == 'never':
+        return numpy.zeros(len(values), dtype=bool)
+    if kind not in ('value', 'values', 'range', 'blank') or \
+            entry[2] not in ('=', 'ne'):
+        return None
+
+    if kind == 'range':
+        first, last = int(entry[3]), int(entry[4])
+        holds = _by_distinct(values, lambda distinct: _within(
+            numpy.array([v or '' for v in distinct], dtype=str),
+            first, last))
+    else:
+        targets = entry[3:] if kind != 'blank' else ('',)
+        holds = _by_distinct(list(zip(values, lengths)), lambda distinct:
+                             numpy.logical_or.reduce([
+                                 _equals(distinct, target)
+                                 for target in targets]))
+    return holds if entry[2] == '=' else ~holds
+
+
+def _equals(distinct, target):
+    """
+    Returns whether each (value, length) pair is the same as target once
+    both are space padded to the length, like Field.__eq__
+    """
+    values = numpy.array([v or '' for v, length in distinct], dtype=str)
+    lengths = numpy.array([length for v, length in distinct])
+    return (values == target) | (
+        (numpy.char.str_len(values) <= lengths) & (len(target) <= lengths) &
+        (numpy.char.rstrip(values, ' ') == target.rstrip(' ')))
+
+
+def _within(values, first, last):
+    """ Same as Field.within for each value """
+    text = numpy.char.rstrip(values, ' ')
+    # digits other than 0-9 are decimal too, but never written like int()
+    ascii = numpy.char.str_len(numpy.char.encode(text, 'utf-8')) == \
+        numpy.char.str_len(text)
+    whole = numpy.char.isdecimal(text) & ascii & \
+        (numpy.char.str_len(text) <= _MAX_DIGITS) & \
+        ~(numpy.char.startswith(text, '0') & (text != '0'))
+    numbers = numpy.where(whole, text, '0').astype(numpy.int64)
+    return whole & (numbers >= first) & (numbers <= last)
+
+
+def field_column(packets, key):
+    """
+    Returns the values of a field in each packet (a str, or None for
+    blank), the field's length in each, and the KeyError looking the field
+    up raised for any packet, by its position
+    """
+    values = []
+    lengths = []
+    errors = dict()
+    for p, packet in enumerate(packets):
+        try:
+            spec, val = packet[key].spec, packet[key].val
+        except KeyError as e:
+            errors[p] = e
+            values.append(None)
+            lengths.append(1)
+            continue
+        values.append(None if val is None else str(val))
+        lengths.append(spec.length)
+    return values, lengths, errors
+
+
+def condition_mask(packets, entry, predicate, column=field_column):
+    """
+    Returns whether the condition of a blanking rule holds for each packet,
+    and the exception checking it raised for any packet, by its position.
+    `predicate` is the rule's function, which checks the conditions that
+    blanking_mask cannot, and `column` returns the values of the field the
+    rule depends on (see field_column).
+    """
+    if entry[0] == 'never':
+        return numpy.zeros(len(packets), dtype=bool), dict()
+    if entry[0] != 'special':
+        values, lengths, errors = column(packets, entry[1])
+        holds = blanking_mask(entry, values, lengths)
+        if holds is not None:
+            holds[list(errors)] = False
+            return holds, errors
+
+    errors = dict()
+    holds = numpy.zeros(len(packets), dtype=bool)
+    for p, packet in enumerate(packets):
+        try:
+            holds[p] = bool(predicate(packet))
+        except Exception as e:
+            errors[p] = e
+    return holds, errors
+
+
+def empty_mask(values):
+    """ Returns whether each value (a str, or None) is blank, like `empty` """
+    return _by_distinct(values, lambda distinct: numpy.char.strip(
+        numpy.array([v or '' for v in distinct], dtype=str)) == '')
@@ -0,0 +1,99 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+import ast
+import csv
+import inspect
+import re
+import sys
+import textwrap
+import typing
+import warnings
+
+# Columns every conversion reads regardless of the builder
+BASE_COLUMNS = frozenset(['ptid', 'redcap_event_name'])
+
+_identifier = re.compile(r"^[A-Za-z_]\w*$")
+
+
+def _string(node) -> typing.Optional[str]:
+    """ Returns the value of a string literal node, or None """
+    if sys.version_info < (3, 8):
+        return node.s if isinstance(node, ast.Str) else None
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+class Columns(typing.NamedTuple):
+    """ REDCap columns read by some code: exact names and name prefixes """
+    names: typing.FrozenSet[str]
+    prefixes: typing.FrozenSet[str]
+
+    def __or__(self, other):
+        return Columns(self.names | other.names,
+                       self.prefixes | other.prefixes)
+
+    def __contains__(self, column):
+        return column in self.names or column.startswith(tuple(self.prefixes))
+
+
+def redcap_columns(*sources) -> Columns:
+    """
+    Returns the REDCap columns that the given modules or functions may read.
+
+    Builders read most columns with literals like `record['sex']` or
+    `record['LBSSALIV'.lower()]`, but others come from mapping dicts or are
+    built at runtime like `'drugid_' + str(i)`. Rather than try to follow the
+    code, this collects every identifier-like string literal (and its lower
+    case form) and every string that something is appended to, so the result
+    is a superset of what is actually read.
+    """
+    names = set(BASE_COLUMNS)
+    prefixes = set()
+    for source in sources:
+        with warnings.catch_warnings():
+            # Parsing the source again repeats any warnings from compiling it
+            warnings.simplefilter('ignore')
+            tree = ast.parse(textwrap.dedent(inspect.getsource(source)))
+        for node in ast.walk(tree):
+            value = _string(node)
+            if value is not None and _identifier.match(value):
+                names.add(value)
+                names.add(value.lower())
+            elif isinstance(node, ast.BinOp) and \
+                    isinstance(node.op, ast.Add):
+                _add_prefix(prefixes, _string(node.left))
+            elif isinstance(node, ast.JoinedStr) and node.values:
+                _add_prefix(prefixes, _string(node.values[0]))
+    return Columns(frozenset(names), frozenset(prefixes))
+
+
+def _add_prefix(prefixes, value):
+    if value and _identifier.match(value):
+        prefixes.add(value)
+
+
+def projected_reader(fp, columns: Columns) \
+        -> typing.Iterator[typing.Dict[str, str]]:
+    """
+    Reads the CSV like `csv.DictReader`, but each row only contains the
+    header's columns that are in `columns`.
+    """
+    reader = csv.reader(fp)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    keep = [(i, name) for i, name in enumerate(header) if name in columns]
+    width = len(header)
+    for row in reader:
+        # csv.DictReader skips empty lines and pads short rows with None
+        if not row:
+            continue
+        if len(row) < width:
+            row += [None] * (width - len(row))
+        yield {name: row[i] for i, name in keep}
@@ -1,30 +1,34 @@
 import sys
 import csv
+import io
+import json
+import locale
+import os
 import re
 
 import configparser
 
-from collections import defaultdict
 
+def read_config(config_path):
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+
+def get_reqs_dict(config, filter_name):
+    """ Returns the config section of a filter, or None if it has none """
+    reqs = None
+    if config.has_section(filter_name):
+        reqs = dict(config.items(filter_name))
+    return reqs
 
-def validate(func):
-    def read_config(config_path):
-        config = configparser.ConfigParser()
-        config.read(config_path)
-        return config
-
-    def get_reqs_dict(config_path):
-        config = read_config(config_path)
-        reqs = None
-        if config.has_section(func.__name__):
-            reqs = dict(config.items(func.__name__))
-        return reqs
 
+def validate(func):
     def validate_filter(*args, **kwargs):
         config_path = args[1]
         data_dict = None
         if config_path:
-            data_dict = get_reqs_dict(args[1])
+            data_dict = get_reqs_dict(read_config(config_path), func.__name__)
         updated_args = list(args)
         updated_args[1] = data_dict
         func(*updated_args, **kwargs)
@@ -41,6 +45,111 @@ def int_or_string(value, default=-1):
     return returnable
 
 
+# Each filter is also available as a stage: a function taking the CSV's
+# fieldnames and an iterator over its records (dicts, like csv.DictReader's)
+# and returning the fieldnames and records after the filter. Stages are lazy,
+# so a chain of them reads, filters and writes one record at a time.
+
+def run_stages(input_ptr, output_ptr, stages):
+    """ Runs the records of the input CSV through stages into the output """
+    # Blank, not None, for missing values, as when reading a written CSV
+    reader = csv.DictReader(input_ptr, restval='')
+    fieldnames, records = reader.fieldnames, iter(reader)
+    if fieldnames is None:
+        return None
+    for stage in stages:
+        fieldnames, records = stage(fieldnames, records)
+
+    output = csv.DictWriter(output_ptr, fieldnames)
+    output.writeheader()
+    output.writerows(records)
+    return output
+
+
+def record_stage(transform):
+    """
+    Makes a stage that keeps the fieldnames from a generator function that
+    takes and yields records
+    """
+    def stage(fieldnames, records):
+        return fieldnames, transform(records)
+    return stage
+
+
+def tee_stage(stage, output_ptr):
+    """ Makes a stage that also writes the records of `stage` to a CSV """
+    def tee(fieldnames, records):
+        fieldnames, records = stage(fieldnames, records)
+        output = csv.DictWriter(output_ptr, fieldnames)
+        output.writeheader()
+
+        def write(records):
+            for record in records:
+                output.writerow(record)
+                yield record
+        return fieldnames, write(records)
+    return tee
+
+
+def announce_stage(stage, description, err=sys.stderr):
+    """
+    Makes a stage that prints a header with the description when `stage`
+    gets its first record, so messages that follow are from that stage
+    """
+    def announce(fieldnames, records):
+        def first(records):
+            records = iter(records)
+            for record in records:
+                print("--------------%s--------------------" % description,
+                      file=err)
+                yield record
+                break
+            yield from records
+        return stage(fieldnames, first(records))
+    return announce
+
+
+def filter_stages(config_path):
+    """
+    Returns the stages of every filter, in the order nacculator_filters runs
+    them, as (description, intermediate file name, stage). Filters without
+    a section in the config are skipped.
+    """
+    config = read_config(config_path)
+
+    def configured(filter_name, make_stage):
+        reqs = get_reqs_dict(config, filter_name)
+        return make_stage(reqs) if reqs else skip_stage
+
+    def clean_ptid(reqs):
+        with open(reqs['filepath'], 'r') as nacc_packet_file:
+            return clean_ptid_stage(nacc_packet_file)
+
+    return [
+        ("Removing subjects already in current", "clean.csv",
+         configured('filter_clean_ptid', clean_ptid)),
+        ("Replacing drug IDs", "drugs.csv",
+         configured('filter_replace_drug_id',
+                    lambda reqs: replace_drug_id_stage)),
+        ("Fixing Headers", "clean_headers.csv",
+         configured('filter_fix_headers', fix_headers_stage)),
+        ("Filling in Defaults", "default.csv",
+         configured('filter_fill_default', lambda reqs: fill_values_stage(
+             fill_default_values(reqs), defaultCheck=True))),
+        ("Updating fields", "update_fields.csv",
+         configured('filter_update_field', lambda reqs: fill_values_stage(
+             fill_non_blank_values(reqs), blankCheck=True))),
+        ("Fixing Visit Dates", "proper_visitdate.csv",
+         configured('filter_fix_visitdate',
+                    lambda reqs: fix_visitdate_stage)),
+        ("Removing Unnecessary Records", "CleanedPtid_Update.csv",
+         configured('filter_remove_ptid', remove_ptid_stage)),
+        ("Removing Records without VisitDate", "final_Update.csv",
+         configured('filter_eliminate_empty_date',
+                    lambda reqs: eliminate_empty_date_stage)),
+    ]
+
+
 @validate
 def filter_clean_ptid(input_ptr, filter_config, output_ptr):
     if filter_config:
@@ -54,67 +163,84 @@ def filter_clean_ptid(input_ptr, filter_config, output_ptr):
 
 
 def filter_clean_ptid_do(input_ptr, nacc_packet_file, output_ptr):
-    redcap_packet_list = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(redcap_packet_list, output)
-
+    return run_stages(input_ptr, output_ptr,
+                      [clean_ptid_stage(nacc_packet_file)])
+
+
+# REDCap milestone events, which have no visitnum, and the NACC visit number
+# of the milestone
+MILESTONE_EVENTS = [
+    ('M5', ('milestone_5', 'arm_1e')),
+    ('M4', ('milestone_4', 'arm_1d')),
+    ('M3', ('milestone_3', 'arm_1c')),
+    ('M2', ('milestone_2', 'arm_1b')),
+    ('M1', ('milestone_1', 'arm_1a')),
+]
+
+
+def load_current_visits(nacc_packet_file):
+    """
+    Indexes the packets that are Current or Certified in NACC's current-db
+    CSV by (ptid, packet type, visit number)
+    """
     # TODO: Deal with M Flag in Current_db.csv.
-
-    completed_subjs = defaultdict(list)
-    nacc_packet_list = csv.DictReader(nacc_packet_file)
-    for nacc_packet in nacc_packet_list:
-        if nacc_packet['Status'].lower() == "current" \
-          or nacc_packet['Status'].lower() == "certified":
-            nacc_subj_id = nacc_packet['Patient ID']
-            nacc_visit_num = int_or_string(nacc_packet['Visit Num'])
-            completed_subjs[nacc_subj_id].append(nacc_visit_num)
-
-    for redcap_packet in redcap_packet_list:
-        # if they exist in completed subjs (same id and visit num)
-        # then remove them.
-        rc_ptid = redcap_packet['ptid']
-        rc_event = redcap_packet['redcap_event_name']
-
-        if rc_ptid in completed_subjs:
-            for nacc_ptid in completed_subjs:
-                if nacc_ptid == rc_ptid:
-                    if redcap_packet['visitnum']:
-                        rc_visit_num = int_or_string(redcap_packet['visitnum'], -1)
-                    elif nacc_packet['Packet type'] == 'M':
-                        if ('milestone_5' or 'arm_1e') in rc_event:
-                            rc_visit_num = 'M5'
-                        elif ('milestone_4' or 'arm_1d') in rc_event:
-                            rc_visit_num = 'M4'
-                        elif ('milestone_3' or 'arm_1c') in rc_event:
-                            rc_visit_num = 'M3'
-                        elif ('milestone_2' or 'arm_1b') in rc_event:
-                            rc_visit_num = 'M2'
-                        elif ('milestone_1' or 'arm_1a') in rc_event:
-                            rc_visit_num = 'M1'
-                        else:
-                            rc_visit_num = ''
-                            print('Eliminated ptid : ' + rc_ptid +
-                                  " Event Name : " + rc_event +
-                                  " MISSING VISIT NUM", file=sys.stderr)
-                            break
-                    else:
-                        rc_visit_num = ''
-                        print('Eliminated ptid : ' + rc_ptid +
-                              " Event Name : " + rc_event +
-                              " MISSING VISIT NUM", file=sys.stderr)
-                        continue
-                    if rc_ptid in completed_subjs:
-                        if rc_visit_num in completed_subjs[rc_ptid]:
-                            print('Eliminated ptid : ' + rc_ptid +
-                                  " Event Name : " + rc_event + " IN CURRENT",
-                                  file=sys.stderr)
-                            break
-                else:
+    completed = set()
+    for nacc_packet in csv.DictReader(nacc_packet_file):
+        if nacc_packet['Status'].lower() in ("current", "certified"):
+            completed.add((nacc_packet['Patient ID'],
+                           nacc_packet['Packet type'],
+                           int_or_string(nacc_packet['Visit Num'])))
+    return completed
+
+
+def _milestone_visit_num(rc_event):
+    for visit_num, events in MILESTONE_EVENTS:
+        if any(event in rc_event for event in events):
+            return visit_num
+    return None
+
+
+def clean_ptid_stage(nacc_packet_file):
+    completed = load_current_visits(nacc_packet_file)
+    completed_subjs = {ptid for ptid, _, _ in completed}
+    # Numbered visits are looked up without their packet type, which REDCap
+    # does not have; the visit number alone identifies the visit
+    completed_visits = {(ptid, visit_num)
+                        for ptid, packet_type, visit_num in completed
+                        if packet_type != 'M'}
+
+    @record_stage
+    def stage(redcap_packet_list):
+        for redcap_packet in redcap_packet_list:
+            # if they exist in completed subjs (same id and visit num)
+            # then remove them.
+            rc_ptid = redcap_packet['ptid']
+            rc_event = redcap_packet['redcap_event_name']
+
+            if rc_ptid not in completed_subjs:
+                yield redcap_packet
+                continue
+
+            if redcap_packet['visitnum']:
+                rc_visit_num = int_or_string(redcap_packet['visitnum'], -1)
+                in_current = (rc_ptid, rc_visit_num) in completed_visits
+            else:
+                rc_visit_num = _milestone_visit_num(rc_event)
+                if rc_visit_num is None:
+                    print('Eliminated ptid : ' + rc_ptid +
+                          " Event Name : " + rc_event +
+                          " MISSING VISIT NUM", file=sys.stderr)
                     continue
-                output.writerow(redcap_packet)
-        else:
-            output.writerow(redcap_packet)
-    return output
+                in_current = (rc_ptid, 'M', rc_visit_num) in completed
+
+            if in_current:
+                print('Eliminated ptid : ' + rc_ptid +
+                      " Event Name : " + rc_event + " IN CURRENT",
+                      file=sys.stderr)
+            else:
+                yield redcap_packet
+
+    return stage
 
 
 def write_headers(reader, output):
@@ -135,26 +261,33 @@ def filter_replace_drug_id(input_ptr, filter_meta, output_ptr):
 
 
 def filter_replace_drug_id_do(input_ptr, output_ptr):
-    reader = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(reader, output)
-    for record in reader:
-        count = 0
-        prefixes = ['', 'fu_', 'tele_']
-        for prefix in prefixes:
-            for i in range(1, 31):
-                col_name = prefix + 'drugid_' + str(i)
-                if col_name in list(record.keys()):
-                    col_value = record[col_name]
-                    if len(col_value) > 0:
-                        record[col_name] = 'd' + col_value[1:]
-                        count += 1
-        output.writerow(record)
-        print('Processed ptid : ' + record['ptid'] + ' Updated ' + str(count) +
-              ' fields.', file=sys.stderr)
+    run_stages(input_ptr, output_ptr, [replace_drug_id_stage])
     return
 
 
+def replace_drug_id_stage(fieldnames, records):
+    # Only the drug ID columns in the header have to be looked at
+    present = set(fieldnames)
+    drug_columns = [prefix + 'drugid_' + str(i)
+                    for prefix in ['', 'fu_', 'tele_']
+                    for i in range(1, 31)
+                    if prefix + 'drugid_' + str(i) in present]
+
+    def replace(records):
+        for record in records:
+            count = 0
+            for col_name in drug_columns:
+                col_value = record[col_name]
+                if len(col_value) > 0:
+                    record[col_name] = 'd' + col_value[1:]
+                    count += 1
+            yield record
+            print('Processed ptid : ' + record['ptid'] + ' Updated ' +
+                  str(count) + ' fields.', file=sys.stderr)
+
+    return fieldnames, replace(records)
+
+
 @validate
 def filter_fix_headers(input_file, header_mapping, output_file):
     if header_mapping:
@@ -175,6 +308,25 @@ def filter_fix_headers_do(input_ptr, header_dictionary, output_ptr):
     return
 
 
+def fix_headers_stage(header_dictionary):
+    def stage(fieldnames, records):
+        fixed_fieldnames = [header_dictionary.get(header, header)
+                            for header in fieldnames]
+        # Records are dicts, so two columns with the same name would lose one
+        duplicates = sorted(set(header for header in fixed_fieldnames
+                                if fixed_fieldnames.count(header) > 1))
+        if duplicates:
+            raise ValueError("filter_fix_headers gives more than one column"
+                             " the name: %s" % ", ".join(duplicates))
+        columns = list(zip(fixed_fieldnames, fieldnames))
+
+        def rename(records):
+            for record in records:
+                yield {fixed: record[header] for fixed, header in columns}
+        return fixed_fieldnames, rename(records)
+    return stage
+
+
 @validate
 def filter_remove_ptid(input_ptr, filter_config, output_ptr):
     if filter_config:
@@ -185,22 +337,28 @@ def filter_remove_ptid(input_ptr, filter_config, output_ptr):
 
 
 def filter_remove_ptid_do(input_ptr, filter_diction, output_ptr):
+    run_stages(input_ptr, output_ptr, [remove_ptid_stage(filter_diction)])
+
+
+def remove_ptid_stage(filter_diction):
     regex_exp = filter_diction['ptid_format']
     good_ptids_list = load_special_case_ptid('good_ptid', filter_diction)
     bad_ptids_list = load_special_case_ptid('bad_ptid', filter_diction)
-    reader = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(reader, output)
-    for record in reader:
+
+    @record_stage
+    def stage(records):
         prog = re.compile(regex_exp)
-        if record['ptid'] in bad_ptids_list:
-            print('Removed ptid : ' + record['ptid'], file=sys.stderr)
-        elif record['ptid'] in good_ptids_list:
-            output.writerow(record)
-        elif prog.match(record['ptid']) != None:
-            output.writerow(record)
-        else:
-            print('Removed ptid : ' + record['ptid'], file=sys.stderr)
+        for record in records:
+            if record['ptid'] in bad_ptids_list:
+                print('Removed ptid : ' + record['ptid'], file=sys.stderr)
+            elif record['ptid'] in good_ptids_list:
+                yield record
+            elif prog.match(record['ptid']) != None:
+                yield record
+            else:
+                print('Removed ptid : ' + record['ptid'], file=sys.stderr)
+
+    return stage
 
 
 @validate
@@ -213,14 +371,16 @@ def filter_eliminate_empty_date(input_ptr, filter_meta, output_ptr):
 
 
 def filter_eliminate_empty_date_do(input_ptr, output_ptr):
-    reader = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(reader, output)
-    for record in reader:
+    run_stages(input_ptr, output_ptr, [eliminate_empty_date_stage])
+
+
+@record_stage
+def eliminate_empty_date_stage(records):
+    for record in records:
         if _invalid_date(record):
             print(' Empty Visit Date ' + record['ptid'], file=sys.stderr)
         else:
-            output.writerow(record)
+            yield record
 
 
 def _invalid_date(record):
@@ -230,26 +390,38 @@ def _invalid_date(record):
 
 def fill_value_of_fields(input_ptr, output_ptr, keysDict, blankCheck=False,
                          defaultCheck=False):
-    reader = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(reader, output)
-    for record in reader:
-        count = 0
-        for col_name in list(keysDict.keys()):
-            if col_name in list(record.keys()):
-                if blankCheck and (len(record[col_name]) > 0) and \
-                  (record[col_name] != keysDict[col_name]):
-                    record[col_name] = keysDict[col_name]
-                    count += 1
-                elif defaultCheck and len(record[col_name]) == 0:
-                    record[col_name] = keysDict[col_name]
-                    count += 1
-        output.writerow(record)
-        print('Processed ptid : ' + record['ptid'] + ' Updated ' + str(count) +
-              ' fields.', file=sys.stderr)
+    run_stages(input_ptr, output_ptr,
+               [fill_values_stage(keysDict, blankCheck, defaultCheck)])
     return
 
 
+def fill_values_stage(keysDict, blankCheck=False, defaultCheck=False):
+    def stage(fieldnames, records):
+        # Only the columns of keysDict in the header have to be looked at
+        present = set(fieldnames)
+        fill_columns = [(col_name, value) for col_name, value
+                        in keysDict.items() if col_name in present]
+
+        def fill(records):
+            for record in records:
+                count = 0
+                for col_name, value in fill_columns:
+                    if blankCheck and (len(record[col_name]) > 0) and \
+                      (record[col_name] != value):
+                        record[col_name] = value
+                        count += 1
+                    elif defaultCheck and len(record[col_name]) == 0:
+                        record[col_name] = value
+                        count += 1
+                yield record
+                print('Processed ptid : ' + record['ptid'] + ' Updated ' +
+                      str(count) + ' fields.', file=sys.stderr)
+
+        return fieldnames, fill(records)
+
+    return stage
+
+
 @validate
 def filter_fix_visitdate(input_ptr, filter_meta, output_ptr):
     if filter_meta:
@@ -260,15 +432,17 @@ def filter_fix_visitdate(input_ptr, filter_meta, output_ptr):
 
 
 def filter_fix_visitdate_do(input_ptr, output_ptr):
-    reader = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(reader, output)
-    for record in reader:
+    run_stages(input_ptr, output_ptr, [fix_visitdate_stage])
+    return
+
+
+@record_stage
+def fix_visitdate_stage(records):
+    for record in records:
         if record['visitnum']:
             record['visitnum'] = int_or_string(record['visitnum'])
         print('Processed ptid : ' + record['ptid'], file=sys.stderr)
-        output.writerow(record)
-    return
+        yield record
 
 
 @validate
@@ -310,36 +484,135 @@ def fill_non_blank_values(config):
 
 
 def skip_filter(input_ptr, output_ptr):
-    reader = csv.DictReader(input_ptr)
-    output = csv.DictWriter(output_ptr, None)
-    write_headers(reader, output)
-    for record in reader:
-        output.writerow(record)
-    print('Filter skipped.', file=sys.stderr)
+    run_stages(input_ptr, output_ptr, [skip_stage])
     return
 
 
+def skip_stage(fieldnames, records):
+    print('Filter skipped.', file=sys.stderr)
+    return fieldnames, records
+
+
 def filter_extract_ptid(input_ptr, Ptid, visit_num, visit_type, output_ptr):
     reader = csv.DictReader(input_ptr)
     output = csv.DictWriter(output_ptr, None)
     write_headers(reader, output)
 
+    matches = extract_ptid_predicate(Ptid, visit_num, visit_type)
+    output.writerows(row for row in reader if matches(row))
+
+
+def extract_ptid_predicate(Ptid, visit_num, visit_type):
+    """ Returns a function telling whether a record is one getPtid wants """
+    if visit_type:
+        visit_type = re.compile(visit_type)
+
     if(visit_num and visit_type):
-        filtered = [row for row in reader if
-                    filter_csv_all(Ptid, visit_num, visit_type, row)]
+        return lambda row: filter_csv_all(Ptid, visit_num, visit_type, row)
 
     elif(not visit_num and visit_type):
-        filtered = [row for row in reader if
-                    filter_csv_vtype(Ptid, visit_type, row)]
+        return lambda row: filter_csv_vtype(Ptid, visit_type, row)
 
     elif(not visit_type and visit_num):
-        filtered = [row for row in reader if
-                    filter_csv_vnum(Ptid, visit_num, row)]
+        return lambda row: filter_csv_vnum(Ptid, visit_num, row)
 
-    elif(not visit_type and not visit_num):
-        filtered = [row for row in reader if
-                    filter_csv_ptid(Ptid, row)]
-    output.writerows(filtered)
+    else:
+        return lambda row: filter_csv_ptid(Ptid, row)
+
+
+# Extension of the sidecar index file filter_extract_ptid_indexed keeps next
+# to the CSV
+PTID_INDEX_SUFFIX = '.ptid-index.json'
+
+
+def build_ptid_index(csv_path, encoding=None):
+    """
+    Returns an index of the CSV's rows by ptid: for each ptid, the visitnum,
+    redcap_event_name and byte offsets (start, end) of each of its rows.
+    The header's offsets are kept too, along with the size and modification
+    time of the file so a stale index can be detected.
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    stat = os.stat(csv_path)
+    rows = dict()
+    with open(csv_path, 'rb') as fp:
+        offsets = [0]
+
+        def lines():
+            for line in fp:
+                offsets[0] += len(line)
+                yield line.decode(encoding)
+
+        reader = csv.reader(lines())
+        header = next(reader, [])
+        header_span = [0, offsets[0]]
+        columns = [header.index(name) if name in header else None
+                   for name in ('ptid', 'visitnum', 'redcap_event_name')]
+
+        while True:
+            start = offsets[0]
+            row = next(reader, None)
+            if row is None:
+                break
+            if not row:
+                continue
+            ptid, visitnum, event = [
+                row[i] if i is not None and i < len(row) else ''
+                for i in columns]
+            rows.setdefault(ptid, []).append(
+                [visitnum, event, start, offsets[0]])
+
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+            'header': header_span, 'rows': rows}
+
+
+def load_ptid_index(csv_path, encoding=None):
+    """
+    Returns the sidecar index of the CSV, building it and saving it next to
+    the CSV first if there is none or the CSV has changed since
+    """
+    index_path = csv_path + PTID_INDEX_SUFFIX
+    stat = os.stat(csv_path)
+    try:
+        with open(index_path, 'r') as fp:
+            index = json.load(fp)
+        if index['size'] == stat.st_size and \
+                index['mtime_ns'] == stat.st_mtime_ns:
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = build_ptid_index(csv_path, encoding)
+    with open(index_path, 'w') as fp:
+        json.dump(index, fp)
+    return index
+
+
+def filter_extract_ptid_indexed(csv_path, Ptid, visit_num, visit_type,
+                                output_ptr, encoding=None):
+    """
+    Same as filter_extract_ptid, but reads only the rows of the ptid, using
+    the sidecar index of the CSV (see load_ptid_index)
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    index = load_ptid_index(csv_path, encoding)
+    matches = extract_ptid_predicate(Ptid, visit_num, visit_type)
+
+    with open(csv_path, 'rb') as fp:
+        def read(start, end):
+            fp.seek(start)
+            return fp.read(end - start).decode(encoding)
+
+        fieldnames = next(csv.reader(io.StringIO(read(*index['header']))))
+        output = csv.DictWriter(output_ptr, fieldnames)
+        output.writeheader()
+
+        for visitnum, event, start, end in index['rows'].get(Ptid, []):
+            key = {'ptid': Ptid, 'visitnum': visitnum,
+                   'redcap_event_name': event}
+            if matches(key):
+                output.writerows(csv.DictReader(io.StringIO(read(start, end)),
+                                                fieldnames=fieldnames))
 
 
 def filter_csv_all(Ptid, visit_num, visit_type, record):
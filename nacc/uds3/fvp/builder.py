@@ -103,7 +103,7 @@ def build_uds3_fvp_form(record, err=sys.stderr):
     add_d1(record, packet)
     add_d2(record, packet)
     try:
-        clsform.add_cls(record, packet, fvp_forms)
+        clsform.add_cls(record, packet, fvp_forms, err)
     except KeyError:
         pass
     update_header(record, packet)
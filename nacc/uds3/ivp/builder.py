@@ -106,7 +106,7 @@ def build_uds3_ivp_form(record, err=sys.stderr):
     add_d1(record, packet)
     add_d2(record, packet)
     try:
-        clsform.add_cls(record, packet, ivp_forms)
+        clsform.add_cls(record, packet, ivp_forms, err)
     except KeyError:
         pass
     update_header(record, packet)
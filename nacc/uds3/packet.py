@@ -4,37 +4,112 @@
 # Use of this source code is governed by the license found in the LICENSE file.
 ###############################################################################
 
+# Marks a field name whose first occurrence is in a multi-instance form
+_MULTI_INSTANCE = object()
+
 
 class Packet(list):
     """
     A collection of UDS Forms
 
     This class is makes it convenient to access a field, which are all uniquely
-    named, regardless of which form they are in with the exception of A4D.
+    named, regardless of which form they are in with the exception of forms
+    that may appear more than once in a packet (see `MULTI_INSTANCE_FORMS`).
+
+    An index of field name to Field is kept up to date as forms are added, so
+    looking up a field does not require searching through every form.
     """
 
-    def __init__(self):
-        self._cache = dict()
+    # Names of forms (see FieldBag.form_name) that may occur more than once
+    MULTI_INSTANCE_FORMS = frozenset(['A4D'])
+
+    def __init__(self, *args):
+        super(Packet, self).__init__(*args)
+        self._reindex()
 
     def __getitem__(self, key):
         """
-        Searches through each form in the packet for the field, `key`
+        Returns the field named `key` from the first form that contains it
 
-        Note: you cannot access fields in A4D in this manner since there is no
-        guarantee there will only be one; a KeyError will be raised.
+        Note: you cannot access fields in a multi-instance form such as A4D in
+        this manner since there is no guarantee there will only be one; a
+        KeyError will be raised.
 
         Example:
             packet['RESTTRL'] is equivalent to:
             packet.__getitem__('RESTTRL')
         """
-        if key in self._cache:
-            return self._cache[key]
+        if not isinstance(key, str):
+            return super(Packet, self).__getitem__(key)
+
+        field = self._index.get(key)
+        if field is None:
+            raise KeyError(key)
+        if field is _MULTI_INSTANCE:
+            raise KeyError("Form %s is unsupported" % self._multi_instance[key])
+        return field
+
+    def append(self, form):
+        super(Packet, self).append(form)
+        self._index_form(form)
+
+    def extend(self, forms):
+        forms = list(forms)
+        super(Packet, self).extend(forms)
+        for form in forms:
+            self._index_form(form)
+
+    def __iadd__(self, forms):
+        self.extend(forms)
+        return self
+
+    def insert(self, i, form):
+        super(Packet, self).insert(i, form)
+        self._reindex()
+
+    def __setitem__(self, i, form):
+        super(Packet, self).__setitem__(i, form)
+        self._reindex()
+
+    def __delitem__(self, i):
+        super(Packet, self).__delitem__(i)
+        self._reindex()
+
+    def remove(self, form):
+        super(Packet, self).remove(form)
+        self._reindex()
+
+    def pop(self, *args):
+        form = super(Packet, self).pop(*args)
+        self._reindex()
+        return form
+
+    def clear(self):
+        super(Packet, self).clear()
+        self._reindex()
+
+    def sort(self, *args, **kwargs):
+        super(Packet, self).sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self):
+        super(Packet, self).reverse()
+        self._reindex()
 
-        for form in self:
-            if key in form.fields:
-                if "A4D" in str(form.__class__):
-                    raise KeyError("Form A4D is unsupported")
-                self._cache[key] = form.fields[key]
-                return self._cache[key]
+    def _index_form(self, form):
+        """ Adds the fields of `form` that are not already indexed """
+        if form.form_name in self.MULTI_INSTANCE_FORMS:
+            for name in form.fields:
+                if name not in self._index:
+                    self._index[name] = _MULTI_INSTANCE
+                    self._multi_instance[name] = form.form_name
+        else:
+            for name, field in form.fields.items():
+                self._index.setdefault(name, field)
 
-        raise KeyError(key)
+    def _reindex(self):
+        """ Rebuilds the index after forms were inserted or reordered """
+        self._index = dict()
+        self._multi_instance = dict()
+        for form in list.__iter__(self):
+            self._index_form(form)
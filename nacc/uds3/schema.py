@@ -0,0 +1,111 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+# Builds the form classes of a packet from its schema: a forms.json file next
+# to its forms.py, generated by `tools/generator.py --json`.
+#
+# The schema has the rows of the header fields and of each form's fields, in
+# order. A row is the field's name, type, [start, end] position, length,
+# inclusive range (or null), allowable values and blanking rules. A bound of a
+# range can be relative to the current year, like "CURRENT_YEAR - 15".
+#
+# The rules are also compiled by the generator, with the parser of the family
+# of blanking rules in the schema's "family": a row then ends with the entry
+# of each of its rules (see parse_rule in nacc/uds3/blanks.py).
+
+import json
+import os
+import re
+import sys
+from datetime import date
+
+import nacc.uds3
+
+CURRENT_YEAR = date.today().year
+
+_YEAR_BOUND = re.compile(r'^CURRENT_YEAR(?:\s*([+-])\s*(\d+))?$')
+
+# Compiled blanking rules of the schemas loaded, keyed by (family, field name,
+# rule text)
+_rule_entries = dict()
+
+
+def define_forms(namespace, filename='forms.json'):
+    """
+    Defines header_fields and a Form class for each form of the schema in a
+    module's namespace (its globals()). The schema is looked up next to the
+    module.
+    """
+    path = os.path.join(os.path.dirname(namespace['__file__']), filename)
+    with open(path) as fp:
+        schema = json.load(fp)
+
+    header = schema['header']
+    family = schema.get('family')
+    if family:
+        for rows in [header] + list(schema['forms'].values()):
+            for row in rows:
+                for rule, entry in zip(row[6], row[7] if row[7:] else []):
+                    _rule_entries[(family, row[0], rule)] = tuple(entry)
+
+    def header_fields():
+        return _fields(header)
+
+    namespace['header_fields'] = header_fields
+    for form_id, rows in schema['forms'].items():
+        namespace['Form' + form_id] = _form_class(
+            form_id, header_fields, rows, namespace['__name__'])
+
+
+def rule_entry(family, name, rule):
+    """
+    Returns the entry compiled for a blanking rule of a field when its form
+    was generated, or None if the rule was not compiled for that family
+    """
+    return _rule_entries.get((family, name, rule))
+
+
+def _form_class(form_id, header_fields, rows, module):
+    # Like the forms generated as Python, FieldBag only runs __init__ for the
+    # first instance and shares the specs of its fields with the others
+    def __init__(self):
+        self.fields = header_fields()
+        self.fields.update(_fields(rows))
+
+    name = 'Form' + form_id
+    return type(name, (nacc.uds3.FieldBag,), {
+        '__init__': __init__, '__module__': module, '__qualname__': name})
+
+
+def _fields(rows):
+    fields = dict()
+    for row in rows:
+        name, typename, position, length, inclusive_range, \
+            allowable_values, blanks = row[:7]
+        if inclusive_range:
+            inclusive_range = tuple(_bound(b) for b in inclusive_range)
+        fields[name] = nacc.uds3.Field(
+            name=name, typename=typename, position=tuple(position),
+            length=length, inclusive_range=inclusive_range,
+            allowable_values=allowable_values,
+            # many fields have the same rules, which JSON loads as copies
+            blanks=[sys.intern(rule) for rule in blanks])
+    return fields
+
+
+def _bound(bound):
+    if not isinstance(bound, str):
+        return bound
+    match = _YEAR_BOUND.match(bound)
+    if not match:
+        raise ValueError('Range bound "%s" is not a number or relative to'
+                         ' CURRENT_YEAR' % bound)
+    sign, years = match.groups()
+    if sign == '+':
+        return CURRENT_YEAR + int(years)
+    if sign == '-':
+        return CURRENT_YEAR - int(years)
+    return CURRENT_YEAR
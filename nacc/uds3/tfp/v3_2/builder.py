@@ -67,7 +67,7 @@ def build_uds3_tfp_new_form(record, err=sys.stderr):
     add_d1(record, packet)
     add_d2(record, packet)
     try:
-        clsform.add_cls(record, packet, tfp_new_forms)
+        clsform.add_cls(record, packet, tfp_new_forms, err)
     except KeyError:
         pass
     update_header(record, packet)
@@ -23,6 +23,7 @@ setup(
 
     package_dir={'nacc': 'nacc'},
     packages=find_packages(),
+    package_data={'': ['forms.json']},
 
     entry_points={
         "console_scripts": [
@@ -35,5 +36,10 @@ setup(
         "PyCap>=2.1.0"
     ],
 
+    extras_require={
+        # for redcap2nacc -batch
+        "batch": ["numpy"]
+    },
+
     python_requires=">=3.6.0",
 )
@@ -0,0 +1,104 @@
+import csv
+import io
+import unittest
+
+import nacc.uds3
+from nacc import redcap2nacc
+from nacc.uds3 import batch
+from nacc.uds3 import packet
+from nacc.uds3.ivp import forms as ivp_forms
+from tests.test_csf_blanks import make_filled_form
+
+
+@unittest.skipIf(not batch.available(), 'requires numpy')
+class TestBlanksBatch(unittest.TestCase):
+    '''
+    Checking the blanking rules of a block of packets at once should give
+    each packet the warnings (or exception) check_blanks gives it.
+    '''
+
+    class option():
+        flag = 'ivp'
+        cv = False
+        csf = False
+        lbd = False
+        ftld = False
+        ivp = True
+        fvp = False
+
+    def make_csv(self):
+        records = []
+        for i in range(1, 11):
+            record = make_filled_form()
+            record['ptid'] = str(i)
+            if i % 4 == 0:
+                # Out of range month makes the builder fail
+                record['csfabmo'] = '13'
+            records.append(record)
+
+        data = io.StringIO()
+        writer = csv.DictWriter(data, fieldnames=list(records[0].keys()))
+        writer.writeheader()
+        writer.writerows(records)
+        return data.getvalue()
+
+    def run_convert(self, flags):
+        out = io.StringIO()
+        err = io.StringIO()
+        redcap2nacc.convert(io.StringIO(self.make_csv()),
+                            redcap2nacc.parse_args(flags), out, err)
+        return out.getvalue(), err.getvalue()
+
+    def make_packet(self, hispanic, hispor, hisporx=''):
+        a1 = ivp_forms.FormA1()
+        a1.FORMID = 'A1'
+        a1.HISPANIC = hispanic
+        a1.HISPOR = hispor
+        a1.HISPORX = hisporx
+        return packet.Packet([a1])
+
+    def test_same_as_check_blanks(self):
+        class FormX(nacc.uds3.FieldBag):
+            def __init__(self):
+                self.fields = {'OTHER': nacc.uds3.Field(
+                    name='OTHER', typename='Char', position=(1, 5),
+                    length=5, blanks=['Blank if Question 1 MISSING = 1'])}
+
+        failing = packet.Packet([FormX()])
+        failing[0].OTHER = 'Yes'
+        packets = [self.make_packet('0', '1'), self.make_packet('1', '1'),
+                   self.make_packet('0', '', 'Other'), failing,
+                   self.make_packet('', '', ''), packet.Packet([FormX()])]
+        options = self.option()
+
+        results = redcap2nacc.check_blanks_batch(packets, options)
+        self.assertEqual(len(results), len(packets))
+        for ipacket, result in zip(packets, results):
+            try:
+                expected = redcap2nacc.check_blanks(ipacket, options)
+            except KeyError:
+                self.assertIsInstance(result, KeyError)
+            else:
+                self.assertListEqual(result, expected)
+        self.assertTrue(results[0])
+        self.assertListEqual(results[1], [])
+        self.assertIsNone(results[3].__context__)
+
+    def test_mask_of_any_of_values(self):
+        values = ['0', '9', '1', None, '09', '9 ']
+        holds = batch.blanking_mask(('values', 'KEY', '=', '0', '9'),
+                                    values, [1, 1, 1, 1, 2, 2])
+        self.assertListEqual(holds.tolist(),
+                             [True, True, False, False, False, True])
+        holds = batch.blanking_mask(('values', 'KEY', 'ne', '0', '9'),
+                                    values, [1, 1, 1, 1, 2, 2])
+        self.assertListEqual(holds.tolist(),
+                             [False, False, True, True, True, False])
+
+    def test_convert_gives_same_output(self):
+        expected = self.run_convert(['-csf'])
+        self.assertEqual(self.run_convert(['-csf', '-batch']), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+import nacc.uds3
+from nacc import redcap2nacc
+from nacc.uds3 import blanks as blanks_uds3
+from nacc.uds3 import packet
+from nacc.uds3.ivp import forms as ivp_forms
+
+
+class option():
+    flag = 'ivp'
+    cv = False
+    csf = False
+    lbd = False
+    ftld = False
+    ivp = True
+    fvp = False
+
+
+class TestBlankingRuleCache(unittest.TestCase):
+    '''
+    Blanking rules should be parsed once per (family, field, rule) and then
+    reused for every packet checked afterwards.
+    '''
+
+    def setUp(self):
+        self.options = option()
+        redcap2nacc._compiled_blanking_rules.clear()
+        redcap2nacc._blanking_indexes.clear()
+
+    def make_packet(self, hispanic, hispor):
+        a1 = ivp_forms.FormA1()
+        a1.FORMID = 'A1'
+        a1.HISPANIC = hispanic
+        a1.HISPOR = hispor
+        ipacket = packet.Packet()
+        ipacket.append(a1)
+        return ipacket
+
+    def test_rules_are_compiled_once(self):
+        with mock.patch.object(
+                blanks_uds3, 'compile_rule',
+                wraps=blanks_uds3.compile_rule) as convert, \
+                mock.patch.object(
+                    blanks_uds3, 'parse_rule',
+                    wraps=blanks_uds3.parse_rule) as parse:
+            for _ in range(3):
+                redcap2nacc.check_blanks(
+                    self.make_packet('0', '1'), self.options)
+
+        compiled = convert.call_count
+        self.assertEqual(compiled, len(redcap2nacc._compiled_blanking_rules))
+        # the rules of generated forms were parsed by the generator
+        self.assertEqual(parse.call_count, 0)
+        self.assertIn(
+            ('uds3', 'HISPOR', 'Blank if Question 8 HISPANIC ne 1 (Yes)'),
+            redcap2nacc._compiled_blanking_rules)
+
+    def test_cached_rules_give_same_warnings(self):
+        expected = ["HISPOR in form A1  is '1 ' with length '2', but should be"
+                    " blank: 'Blank if Question 8 HISPANIC ne 1 (Yes)'."]
+        first = redcap2nacc.check_blanks(
+            self.make_packet('0', '1'), self.options)
+        second = redcap2nacc.check_blanks(
+            self.make_packet('0', '1'), self.options)
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+
+        not_blank = redcap2nacc.check_blanks(
+            self.make_packet('1', '1'), self.options)
+        self.assertEqual(not_blank, [])
+
+    def test_shared_condition_is_checked_once(self):
+        ipacket = self.make_packet('0', '1')
+        ipacket[0].HISPORX = 'Other'
+        lookups = []
+        getitem = packet.Packet.__getitem__
+
+        def spy(self, key):
+            lookups.append(key)
+            return getitem(self, key)
+
+        with mock.patch.object(packet.Packet, '__getitem__', spy):
+            warnings = redcap2nacc.check_blanks(ipacket, self.options)
+
+        self.assertEqual(lookups.count('HISPANIC'), 1)
+        self.assertEqual([w.split()[0] for w in warnings],
+                         ['HISPOR', 'HISPORX', 'HISPORX'])
+
+    def test_failing_condition_only_raises_for_a_value(self):
+        class FormX(nacc.uds3.FieldBag):
+            def __init__(self):
+                self.fields = {'OTHER': nacc.uds3.Field(
+                    name='OTHER', typename='Char', position=(1, 5),
+                    length=5, blanks=['Blank if Question 1 MISSING = 1'])}
+
+        ipacket = packet.Packet([FormX()])
+        self.assertEqual(redcap2nacc.check_blanks(ipacket, self.options), [])
+
+        ipacket[0].OTHER = 'Yes'
+        with self.assertRaises(KeyError) as raised:
+            redcap2nacc.check_blanks(ipacket, self.options)
+        # not chained to the lookup of the condition's state
+        self.assertIsNone(raised.exception.__context__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import nacc.uds3
+from nacc.uds3.ivp import forms as ivp_forms
+
+
+class TestCoercionCache(unittest.TestCase):
+    '''
+    Canonical values and validation errors are cached per field spec and raw
+    value, shared by every form, with the same results as computing them.
+    '''
+
+    def setUp(self):
+        nacc.uds3.coercion_cache_clear()
+
+    def test_repeated_values_hit_the_cache(self):
+        for _ in range(3):
+            a1 = ivp_forms.FormA1()
+            a1.SEX = '1'
+            self.assertEqual(a1.SEX.value, '1')
+
+        info = nacc.uds3.coercion_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 5)
+
+    def test_cached_errors_are_raised_every_time(self):
+        raised = []
+        for _ in range(2):
+            a1 = ivp_forms.FormA1()
+            with self.assertRaises(ValueError) as cm:
+                a1.SEX = '7'
+            self.assertIn('for SEX', str(cm.exception))
+            self.assertEqual(a1.SEX.value, ' ')
+            raised.append(cm.exception)
+        self.assertIsNot(raised[0], raised[1])
+
+    def test_types_are_cached_separately(self):
+        a1 = ivp_forms.FormA1()
+        a1.SEX = 1
+        self.assertEqual(a1.SEX.value, '1')
+        a1.fields['SEX'].val = True
+        self.assertEqual(a1.SEX.value, 'True')
+
+    def test_unhashable_values_are_not_cached(self):
+        a1 = ivp_forms.FormA1()
+        with self.assertRaises(ValueError):
+            a1.SEX = ['1']
+        self.assertEqual(nacc.uds3.coercion_cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
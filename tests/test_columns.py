@@ -0,0 +1,78 @@
+import csv
+import io
+import unittest
+
+from nacc import redcap2nacc
+from nacc.uds3 import columns
+
+
+class RecordingRecord(dict):
+    '''
+    A record that has every column, remembering which ones were read.
+    '''
+
+    def __init__(self):
+        super(RecordingRecord, self).__init__()
+        self.read = set()
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        if key == 'visityr':
+            return '2020'
+        if key in ('visitmo', 'visitday'):
+            return '1'
+        if key.endswith(('complete', 'sub', 'anymeds')):
+            return '1'
+        return ''
+
+    def get(self, key, default=None):
+        return self[key]
+
+
+class TestColumns(unittest.TestCase):
+    '''
+    Records are read with only the columns the selected builder may use, so
+    every column a builder reads has to be among them.
+    '''
+
+    def test_builders_only_read_projected_columns(self):
+        for builder in redcap2nacc.BUILDERS:
+            record = RecordingRecord()
+            try:
+                builder.load()(record)
+            except ValueError:
+                pass
+
+            wanted = redcap2nacc.redcap_columns_for(
+                redcap2nacc.parse_args(['-' + f for f in builder.flags]))
+            missing = [c for c in record.read if c not in wanted]
+            self.assertTrue(record.read, builder.function)
+            self.assertListEqual(missing, [], builder.function)
+
+    def test_drug_ids_are_kept_by_prefix(self):
+        wanted = redcap2nacc.redcap_columns_for(
+            redcap2nacc.parse_args(['-fvp']))
+        self.assertIn('fu_drugid_50', wanted)
+        self.assertNotIn('not_a_real_column', wanted)
+
+    def test_packet_type_columns_is_union_of_builders(self):
+        wanted = redcap2nacc.packet_type_columns(['ivp', 'tfp'])
+        for flags in (['-ivp'], ['-tfp']):
+            builder = redcap2nacc.redcap_columns_for(
+                redcap2nacc.parse_args(flags))
+            self.assertTrue(builder.names <= wanted.names)
+        with self.assertRaises(ValueError):
+            redcap2nacc.packet_type_columns(['nope'])
+
+    def test_projected_reader_matches_dict_reader(self):
+        data = 'ptid,junk,sex,extra\n1,a,2,b\n\n2,c\n'
+        wanted = columns.Columns(frozenset(['ptid', 'sex']), frozenset())
+
+        expected = [{k: v for k, v in row.items() if k in ('ptid', 'sex')}
+                    for row in csv.DictReader(io.StringIO(data))]
+        actual = list(columns.projected_reader(io.StringIO(data), wanted))
+        self.assertListEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
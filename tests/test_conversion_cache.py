@@ -0,0 +1,93 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from nacc import redcap2nacc
+from tests.test_csf_blanks import make_filled_form
+
+
+class TestConversionCache(unittest.TestCase):
+    '''
+    Converting with a cache directory should write the same output as
+    converting without one, and only convert the records that changed.
+    '''
+
+    def make_csv(self, edited=None):
+        records = []
+        for i in range(1, 11):
+            record = make_filled_form()
+            record['ptid'] = str(i)
+            if i % 5 == 0:
+                # Violates "Blank if Question 1a CSFABETA = blank"
+                record['csfabeta'] = ''
+            if i == edited:
+                record['csfabmo'] = '2'
+            records.append(record)
+
+        data = io.StringIO()
+        writer = csv.DictWriter(data, fieldnames=list(records[0].keys()))
+        writer.writeheader()
+        writer.writerows(records)
+        return data.getvalue()
+
+    def run_convert(self, data, cache_dir=None, jobs=1):
+        options = redcap2nacc.parse_args(['-csf'])
+        out = io.StringIO()
+        err = io.StringIO()
+        redcap2nacc.convert(io.StringIO(data), options, out, err, jobs=jobs,
+                            cache_dir=cache_dir)
+        return out.getvalue(), err.getvalue()
+
+    def test_cached_conversion_matches_uncached(self):
+        data = self.make_csv()
+        expected = self.run_convert(data)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertEqual(self.run_convert(data, cache_dir), expected)
+            self.assertEqual(self.run_convert(data, cache_dir), expected)
+            self.assertEqual(self.run_convert(data, cache_dir, jobs=2),
+                             expected)
+        self.assertIn("[SKIP] Error for ptid : 5", expected[1])
+
+    def test_only_changed_records_are_converted(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.run_convert(self.make_csv(), cache_dir)
+
+            data = self.make_csv(edited=3)
+            expected = self.run_convert(data)
+            with mock.patch.object(redcap2nacc, 'convert_record',
+                                   wraps=redcap2nacc.convert_record) as spy:
+                self.assertEqual(self.run_convert(data, cache_dir), expected)
+            converted = [c[0][0]['ptid'] for c in spy.call_args_list]
+            self.assertListEqual(converted, ['3'])
+
+    def test_mode_is_part_of_the_key(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            record = {'ptid': '1'}
+            csf = redcap2nacc.conversion_cache.ConversionCache(
+                cache_dir, ['csf'])
+            cv = redcap2nacc.conversion_cache.ConversionCache(
+                cache_dir, ['cv'])
+            self.assertNotEqual(csf.key(record), cv.key(record))
+            csf.put(csf.key(record), ['out', 'err'])
+            self.assertEqual(csf.get(csf.key(record)), ['out', 'err'])
+            self.assertIsNone(cv.get(cv.key(record)))
+            self.assertTrue(os.listdir(cache_dir))
+
+    def test_current_year_is_part_of_the_key(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            record = {'ptid': '1'}
+            cache = redcap2nacc.conversion_cache.ConversionCache(
+                cache_dir, ['csf'])
+            schema = redcap2nacc.conversion_cache.schema
+            with mock.patch.object(schema, 'CURRENT_YEAR',
+                                   schema.CURRENT_YEAR + 1):
+                next_year = redcap2nacc.conversion_cache.ConversionCache(
+                    cache_dir, ['csf'])
+            self.assertNotEqual(cache.key(record), next_year.key(record))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from nacc import redcap2nacc
+from tests.test_covid import make_blank_cv
+from tests.test_tfp_blanks import make_filled_form as make_filled_tfp
+
+
+class TestConvertAll(unittest.TestCase):
+    '''
+    `convert_all` should read the CSV once and route each record to every
+    packet type it matches, writing each packet type to its own file with the
+    same lines a run with that packet type's flag would have written.
+    '''
+
+    def make_csv(self):
+        tfp = make_filled_tfp()
+        tfp['redcap_event_name'] = 'followup_telephone_arm_1'
+        cv = make_blank_cv()
+        cv['ptid'] = '2'
+        cv['redcap_event_name'] = 'covid_survey_arm_1'
+        for prefix in ('c19t1', 'c19t2', 'c19t3', 'c19h1', 'c19h2', 'c19h3'):
+            cv[prefix + 'mo'] = '01'
+            cv[prefix + 'dy'] = '01'
+            cv[prefix + 'yr'] = '2020'
+        records = [tfp, cv]
+
+        fieldnames = []
+        for record in records:
+            fieldnames += [f for f in record if f not in fieldnames]
+        data = io.StringIO()
+        writer = csv.DictWriter(data, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        writer.writerows(records)
+        return data.getvalue()
+
+    def convert_single(self, data, flags):
+        out = io.StringIO()
+        redcap2nacc.convert(io.StringIO(data), redcap2nacc.parse_args(flags),
+                            out, io.StringIO())
+        return out.getvalue()
+
+    def test_each_packet_type_written_to_own_file(self):
+        data = self.make_csv()
+        with tempfile.TemporaryDirectory() as outdir:
+            redcap2nacc.convert_all(io.StringIO(data), outdir, io.StringIO())
+
+            outputs = dict()
+            for name, _ in redcap2nacc.ALL_PACKET_TYPES:
+                with open(os.path.join(outdir, name + '.txt')) as fp:
+                    outputs[name] = fp.read()
+
+        self.assertTrue(outputs['tfp'])
+        self.assertTrue(outputs['cv'])
+        self.assertEqual(outputs['tfp'], self.convert_single(data, ['-tfp']))
+        self.assertEqual(outputs['cv'], self.convert_single(data, ['-cv']))
+        for name, text in outputs.items():
+            if name not in ('tfp', 'cv'):
+                self.assertEqual(text, '', name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+import datetime
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nacc import export
+from nacc.uds3 import columns
+
+
+class StandInRedcap(BaseHTTPRequestHandler):
+    '''
+    Answers REDCap API record exports from `server.records`. A request for
+    more than `server.max_records` ptids gets a 500 error, as does the first
+    request for any ptid in `server.flaky`.
+    '''
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode())
+        assert form['token'] == ['TOKEN']
+        assert form['content'] == ['record']
+        ptids = [value for key, values in sorted(form.items())
+                 if key.startswith('records[') for value in values]
+
+        server = self.server
+        with server.lock:
+            server.requests.append(ptids)
+            flaky = [p for p in ptids if p in server.flaky]
+            server.flaky -= set(flaky)
+        if flaky or len(ptids) > server.max_records:
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        rows = [r for r in server.records if r['ptid'] in ptids]
+        body = json.dumps(rows).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestExport(unittest.TestCase):
+    '''
+    `export_in_chunks` should export every ptid's records in order, retrying
+    and splitting failing chunks, and resume an export that failed.
+    '''
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInRedcap)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.flaky = set()
+        self.server.max_records = 100
+        self.server.records = [
+            {'ptid': '%03d' % i, 'redcap_event_name': event}
+            for i in range(23)
+            for event in ('initial_visit_year_arm_1', 'followup_visit_arm_1')]
+        self.url = 'http://127.0.0.1:%d/api/' % self.server.server_port
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  kwargs={'poll_interval': 0.01})
+        thread.daemon = True
+        thread.start()
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.workdir = os.path.join(tmp.name, 'redcap_export')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def export_records(self, ptids):
+        data = {'token': 'TOKEN', 'content': 'record', 'format': 'json'}
+        for i, ptid in enumerate(ptids):
+            data['records[%d]' % i] = ptid
+        request = urllib.request.Request(
+            self.url, urllib.parse.urlencode(data).encode())
+        with urllib.request.urlopen(request) as response:
+            return json.load(response)
+
+    def export(self, **kwargs):
+        ptids = export.unique_ptids(self.server.records)
+        return list(export.export_in_chunks(
+            self.export_records, ptids, self.workdir, chunk_size=5,
+            workers=3, backoff=0, err=io.StringIO(), **kwargs))
+
+    def test_project_fields_keeps_wanted_columns(self):
+        field_names = [
+            {'original_field_name': 'ptid', 'choice_value': '',
+             'export_field_name': 'ptid'},
+            {'original_field_name': 'sex', 'choice_value': '',
+             'export_field_name': 'sex'},
+            {'original_field_name': 'notes', 'choice_value': '',
+             'export_field_name': 'notes'},
+            {'original_field_name': 'resphear', 'choice_value': '1',
+             'export_field_name': 'resphear___1'},
+        ]
+        wanted = columns.Columns(
+            frozenset(['ptid', 'sex', 'header_complete']),
+            frozenset(['resphear']))
+        fields, exported = export.project_fields(
+            field_names, ['header', 'notes_form'], wanted)
+        self.assertListEqual(fields,
+                             ['ptid', 'sex', 'resphear', 'header_complete'])
+        self.assertListEqual(exported, ['ptid', 'sex', 'resphear___1',
+                                        'header_complete'])
+
+    def test_unique_ptids_keeps_order(self):
+        records = [{'ptid': p} for p in ('2', '1', '2', '3', '1')]
+        self.assertListEqual(export.unique_ptids(records), ['2', '1', '3'])
+
+    def test_records_in_ptid_order(self):
+        self.assertListEqual(self.export(), self.server.records)
+
+    def test_failures_are_retried_and_split(self):
+        self.server.flaky = {'001', '012'}
+        self.server.max_records = 2
+        self.assertListEqual(self.export(), self.server.records)
+        self.assertTrue(all(len(ptids) <= 5
+                            for ptids in self.server.requests))
+
+    def test_failed_export_resumes_missing_chunks(self):
+        def fail_one_chunk(ptids):
+            if '007' in ptids:
+                raise IOError('connection reset')
+            return self.export_records(ptids)
+
+        with self.assertRaises(export.ExportError):
+            list(export.export_in_chunks(
+                fail_one_chunk, export.unique_ptids(self.server.records),
+                self.workdir, chunk_size=5, retries=1, err=io.StringIO()))
+
+        self.server.requests = []
+        self.assertListEqual(self.export(), self.server.records)
+        self.assertListEqual(self.server.requests,
+                             [['005', '006', '007', '008', '009']])
+
+    def test_finished_export_is_not_reused(self):
+        self.assertListEqual(self.export(), self.server.records)
+        self.server.records[0] = {'ptid': '000', 'redcap_event_name': 'new'}
+        self.server.requests = []
+        self.assertListEqual(self.export(), self.server.records)
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_export_of_other_fields_starts_over(self):
+        def fail_one_chunk(ptids):
+            if '007' in ptids:
+                raise IOError('connection reset')
+            return self.export_records(ptids)
+
+        with self.assertRaises(export.ExportError):
+            list(export.export_in_chunks(
+                fail_one_chunk, export.unique_ptids(self.server.records),
+                self.workdir, chunk_size=5, retries=1, err=io.StringIO(),
+                fields=['ptid']))
+
+        self.server.requests = []
+        self.assertListEqual(self.export(fields=['ptid', 'sex']),
+                             self.server.records)
+        self.assertEqual(len(self.server.requests), 5)
+
+
+class TestRecordStore(unittest.TestCase):
+    '''
+    `export_with_store` should export everything once, then only ask for the
+    records modified since the last export, returning the same records a
+    full export would.
+    '''
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.workdir = os.path.join(tmp.name, 'redcap_export')
+        self.store = export.RecordStore(os.path.join(tmp.name, 'store.db'))
+        self.addCleanup(self.store.close)
+        self.records = {
+            '001': [{'ptid': '001', 'visitnum': '1'}],
+            '002': [{'ptid': '002', 'visitnum': '1'},
+                    {'ptid': '002', 'visitnum': '2'}],
+        }
+        self.modified_since = []
+
+    def export_records(self, ptids):
+        return [row for ptid in ptids for row in self.records[ptid]]
+
+    def export_modified(self, since):
+        self.modified_since.append(since)
+        return [row for ptid in self.modified for row in self.records[ptid]]
+
+    def export(self, now, **kwargs):
+        ptids = list(self.records)
+        return list(export.export_with_store(
+            self.export_records, self.export_modified, ptids, self.workdir,
+            self.store, now=lambda: now, err=io.StringIO(), **kwargs))
+
+    def test_only_modified_records_are_exported(self):
+        first = datetime.datetime(2022, 1, 1, 3, 0, 0)
+        self.modified = []
+        self.assertListEqual(self.export(first),
+                             self.export_records(['001', '002']))
+        self.assertListEqual(self.modified_since, [])
+        self.assertEqual(self.store.last_export(), first)
+
+        self.records['002'] = [{'ptid': '002', 'visitnum': '1'},
+                               {'ptid': '002', 'visitnum': '3'}]
+        self.records['003'] = [{'ptid': '003', 'visitnum': '1'}]
+        del self.records['001']
+        self.modified = ['002', '003']
+
+        second = datetime.datetime(2022, 1, 2, 3, 0, 0)
+        self.assertListEqual(self.export(second),
+                             self.export_records(['002', '003']))
+        self.assertListEqual(self.modified_since,
+                             [first - export.EXPORT_OVERLAP])
+        self.assertEqual(self.store.last_export(), second)
+
+    def test_failed_modified_export_is_retried(self):
+        first = datetime.datetime(2022, 1, 1, 3, 0, 0)
+        self.modified = []
+        self.export(first)
+
+        failures = []
+        export_modified = self.export_modified
+
+        def flaky(since):
+            if len(failures) < 2:
+                failures.append(since)
+                raise IOError('connection reset')
+            return export_modified(since)
+
+        self.export_modified = flaky
+        self.modified = ['002']
+        second = datetime.datetime(2022, 1, 2, 3, 0, 0)
+        self.assertListEqual(self.export(second, backoff=0),
+                             self.export_records(['001', '002']))
+        self.assertEqual(len(failures), 2)
+
+        failures.clear()
+        third = datetime.datetime(2022, 1, 3, 3, 0, 0)
+        with self.assertRaises(export.ExportError):
+            self.export(third, retries=2, backoff=0)
+        self.assertEqual(self.store.last_export(), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from nacc.uds3.ivp import forms as ivp_forms
+
+
+class TestFieldSchema(unittest.TestCase):
+    '''
+    The Field specs of a form are created once per form class and shared by
+    every instance; only the values belong to each instance.
+    '''
+
+    def test_instances_share_specs(self):
+        first = ivp_forms.FormA1()
+        second = ivp_forms.FormA1()
+
+        self.assertListEqual(list(first.fields), list(second.fields))
+        for name in first.fields:
+            self.assertIs(first.fields[name].spec, second.fields[name].spec)
+            self.assertIsNot(first.fields[name], second.fields[name])
+
+    def test_values_are_per_instance(self):
+        first = ivp_forms.FormA1()
+        second = ivp_forms.FormA1()
+        first.SEX = '1'
+        second.SEX = '2'
+
+        self.assertEqual(first.SEX.value, '1')
+        self.assertEqual(second.SEX.value, '2')
+        self.assertEqual(ivp_forms.FormA1().SEX.value, ' ')
+
+    def test_non_generated_forms_keep_their_fields(self):
+        a4g = ivp_forms.FormA4G()
+        a4g = ivp_forms.FormA4G()
+        self.assertIn('ANYMEDS', a4g.fields)
+        self.assertIn('PTID', a4g.fields)
+
+    def test_spec_is_immutable(self):
+        spec = ivp_forms.FormA1().fields['REASON'].spec
+        self.assertEqual(spec.allowable_values, frozenset(['1', '2', '4', '9']))
+        with self.assertRaises(AttributeError):
+            spec.length = 2
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import csv
 import io
+import os
+import tempfile
 import unittest
 from nacc.uds3 import filters
 
@@ -46,6 +48,41 @@ ptid,redcap_event_name,formver,adcid,visitmo,visitday,visityr,visitnum,initials,
         expected = ['110002', '110004']
         self.assertListEqual(actual, expected)
 
+    def test_filter_clean_ptid_removes_milestones_in_nacc_current(self):
+        '''
+        `filter_clean_ptid` should remove milestones already in NACC's
+        Current database, wherever their rows are in the current-db CSV.
+        '''
+
+        subjects = '''
+Patient ID,Packet type,Visit Num,Status
+110001,M,M1,Current
+110001,I,001,Current
+110002,I,001,Current
+'''.strip()
+
+        redcap_data = '''
+ptid,redcap_event_name,visitnum
+110001,milestone_1_arm_1,
+110001,milestone_2_arm_1,
+110002,milestone_1_arm_1,
+110002,followup_visit_yea_arm_1,2
+110002,unknown_event_arm_1,
+'''.strip()
+
+        with io.StringIO(redcap_data) as data, \
+                io.StringIO("") as results, \
+                io.StringIO(subjects) as nacc_packet_file:
+            filters.filter_clean_ptid_do(data, nacc_packet_file, results)
+            results.seek(0)
+            actual = [(row['ptid'], row['redcap_event_name'])
+                      for row in csv.DictReader(results)]
+
+        expected = [('110001', 'milestone_2_arm_1'),
+                    ('110002', 'milestone_1_arm_1'),
+                    ('110002', 'followup_visit_yea_arm_1')]
+        self.assertListEqual(actual, expected)
+
     def test_filter_eliminate_empty_date(self):
         '''
         `filter_eliminate_empty_date` should remove data with
@@ -313,6 +350,54 @@ ptid,redcap_event_name,formver,adcid,visitmo,visitday,visityr,visitnum,initials,
         expected = ['110001', '110001', '110001']
         self.assertListEqual(actual, expected)
 
+    def test_filter_extract_ptid_indexed(self):
+        '''
+        `filter_extract_ptid_indexed` should give the same records as
+        `filter_extract_ptid`, and rebuild its index when the CSV changes.
+        '''
+        redcap_data = '''
+ptid,redcap_event_name,visitnum,initials
+110001,initial_visit_year_arm_1,001,ABC
+110002,initial_visit_year_arm_1,001,"A
+B"
+110001,followup_visit_yea_arm_1,002,ABC
+
+110002,followup_visit_yea_arm_1,002,ABC
+'''.lstrip()
+        queries = [('110001', None, None), ('110002', '1', None),
+                   ('110002', None, 'followup'), ('110001', '2', 'initial'),
+                   ('999999', None, None)]
+
+        def extract(ptid, vnum, vtype):
+            with io.StringIO(redcap_data) as data, \
+                    io.StringIO("") as results:
+                filters.filter_extract_ptid(data, ptid, vnum, vtype, results)
+                return results.getvalue()
+
+        def extract_indexed(ptid, vnum, vtype):
+            with io.StringIO("") as results:
+                filters.filter_extract_ptid_indexed(
+                    csv_path, ptid, vnum, vtype, results, encoding='utf-8')
+                return results.getvalue()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, 'data.csv')
+            with open(csv_path, 'w', encoding='utf-8', newline='') as fp:
+                fp.write(redcap_data)
+
+            for query in queries:
+                self.assertEqual(extract_indexed(*query), extract(*query))
+            self.assertTrue(os.path.exists(
+                csv_path + filters.PTID_INDEX_SUFFIX))
+            self.assertIn('"A\nB"', extract_indexed('110002', '1', None))
+
+            redcap_data += '110001,telephone_arm_1,003,XYZ\n'
+            with open(csv_path, 'w', encoding='utf-8', newline='') as fp:
+                fp.write(redcap_data)
+            self.assertIn('XYZ', extract_indexed('110001', None, None))
+            self.assertEqual(extract_indexed('110001', None, None),
+                             extract('110001', None, None))
+
     def test_filter_fix_headers(self):
         '''
         `filter_fix_headers` should change REDCap headers to NACC headers.
@@ -384,6 +469,108 @@ ptid,redcap_event_name,formver,adcid,visitmo,visitday,visityr,visitnum,initials,
         expected_2 = ['d11111', 'd22222', 'd22222', '']
         self.assertListEqual(filter_out_2, expected_2)
 
+    def test_filter_stages_match_running_filters_one_at_a_time(self):
+        '''
+        Running all the filters as stages in one pass should give the same
+        CSV as running each filter over the output of the one before.
+        '''
+
+        subjects = '''
+Patient ID,Packet type,Visit Num,Status
+110001,I,001,Current
+110003,F,002,Working
+'''.strip()
+
+        redcap_data = '''
+ptid,redcap_event_name,formver,adcid,visitmo,visitday,visityr,visitnum,nogds,otherneur,drugid_1,fu_drugid_2
+110001,initial_visit_year_arm_1,3,99,1,1,2019,001,,1,000001,
+110002,initial_visit_year_arm_1,,,1,1,2019,001,1,,,000002
+110003,followup_visit_yea_arm_1,3,12,1,1,2019,002,,2,000003,
+990001,initial_visit_year_arm_1,3,99,1,1,2019,001,,,,
+110004,followup_visit_yea_arm_1,3,99,,1,2019,,,,,
+110005,followup_visit_yea_arm_1
+'''.strip()
+
+        config = '''
+[filter_clean_ptid]
+filepath: {subjects}
+[filter_replace_drug_id]
+present: yes
+[filter_fix_headers]
+otherneur: othneur
+[filter_fill_default]
+adcid: 41
+[filter_update_field]
+adcid: 41
+[filter_fix_visitdate]
+present: yes
+[filter_remove_ptid]
+ptid_format: 11\\d.*
+[filter_eliminate_empty_date]
+present: yes
+'''
+
+        one_at_a_time = [
+            filters.filter_clean_ptid, filters.filter_replace_drug_id,
+            filters.filter_fix_headers, filters.filter_fill_default,
+            filters.filter_update_field, filters.filter_fix_visitdate,
+            filters.filter_remove_ptid, filters.filter_eliminate_empty_date]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            subjects_path = os.path.join(tmp, 'current-db-subjects.csv')
+            with open(subjects_path, 'w') as fp:
+                fp.write(subjects)
+            config_path = os.path.join(tmp, 'nacculator_cfg.ini')
+            with open(config_path, 'w') as fp:
+                fp.write(config.format(subjects=subjects_path))
+
+            expected = redcap_data
+            for filter_function in one_at_a_time:
+                with io.StringIO(expected) as data, \
+                        io.StringIO("") as results:
+                    filter_function(data, config_path, results)
+                    expected = results.getvalue()
+
+            stages = [stage for _, _, stage
+                      in filters.filter_stages(config_path)]
+            intermediate = io.StringIO("")
+            stages[2] = filters.tee_stage(stages[2], intermediate)
+            with io.StringIO(redcap_data) as data, \
+                    io.StringIO("") as results:
+                filters.run_stages(data, results, stages)
+                actual = results.getvalue()
+
+        self.assertEqual(actual, expected)
+        rows = list(csv.DictReader(io.StringIO(actual)))
+        self.assertListEqual([row['ptid'] for row in rows],
+                             ['110002', '110003'])
+        self.assertListEqual([row['adcid'] for row in rows], ['41', '41'])
+        headers = next(csv.reader(io.StringIO(intermediate.getvalue())))
+        self.assertIn('othneur', headers)
+
+    def test_fix_headers_stage_rejects_duplicate_names(self):
+        stage = filters.fix_headers_stage({'otherneur': 'othneur'})
+        with self.assertRaises(ValueError):
+            stage(['ptid', 'otherneur', 'othneur'], iter([]))
+
+    def test_announced_stage_prints_header_with_first_record(self):
+        err = io.StringIO()
+
+        @filters.record_stage
+        def report(records):
+            for record in records:
+                print("Checked " + record['ptid'], file=err)
+                yield record
+
+        stage = filters.announce_stage(report, "Checking", err=err)
+        fieldnames, records = stage(['ptid'], iter([{'ptid': '1'},
+                                                    {'ptid': '2'}]))
+        self.assertEqual(err.getvalue(), "")
+        self.assertEqual(len(list(records)), 2)
+        self.assertEqual(err.getvalue().splitlines(), [
+            "--------------Checking--------------------",
+            "Checked 1", "Checked 2"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+from unittest import mock
 
 from nacc import redcap2nacc
+from nacc.uds3 import packet
 from nacc.ftld.ivp.builder import build_ftld_ivp_form
 
 
@@ -78,10 +80,10 @@ class TestBlankRulesForFTLD(unittest.TestCase):
 
     def test_for_special_case_or2(self):
         '''
-        Have it make sure _blanking_rule_ftld_or2 works properly (and by
-        extension or3, or4, and or5) - This blanking rule depends on either
-        of two possible answers to questions, along with regular
-        blanking rules
+        Have it make sure the rules of the MRI fields work properly (and by
+        extension those of FDG PET, amyloid PET and CBF SPECT) - This
+        blanking rule depends on either of two possible answers to
+        questions, along with regular blanking rules
         '''
         record = make_filled_form()
         record['ftdmrirf'] = '0'
@@ -98,8 +100,8 @@ class TestBlankRulesForFTLD(unittest.TestCase):
 
     def test_for_special_case_FTDMRIOS(self):
         '''
-        Have it make sure _blanking_rule_ftld_or2a works properly -
-        This blanking rule has an extra condition added to the or2 rules
+        Have it make sure the rules of FTDMRIOS work properly - This
+        blanking rule has an extra condition added to the MRI rules
         (packet['FTDMRIOB'] != 1)
         '''
         record = make_filled_form()
@@ -116,6 +118,32 @@ class TestBlankRulesForFTLD(unittest.TestCase):
                     " 'Blank if Question 2a11 FTDMRIOB ne 1 (Yes)'."]
         self.assertEqual(warnings, expected)
 
+    def test_imaging_conditions_are_checked_once(self):
+        '''
+        The imaging fields share the conditions of their question, so each
+        is only checked once for a packet, whatever the number of fields
+        '''
+        record = make_filled_form()
+        record['ftdmrifa'] = '0'
+        record['ftdmrirf'] = '1'
+        record['ftdmrilf'] = '1'
+        record['ftdmrios'] = 'Other'
+        ipacket = build_ftld_ivp_form(record)
+        lookups = []
+        getitem = packet.Packet.__getitem__
+
+        def spy(self, key):
+            lookups.append(key)
+            return getitem(self, key)
+
+        with mock.patch.object(packet.Packet, '__getitem__', spy):
+            warnings = redcap2nacc.check_blanks(ipacket, self.options)
+
+        self.assertEqual(lookups.count('FTDMRIFA'), 1)
+        self.assertEqual(lookups.count('FTDIDIAG'), 1)
+        self.assertEqual([w.split()[0] for w in warnings],
+                         ['FTDMRIRF', 'FTDMRILF', 'FTDMRIOB', 'FTDMRIOS'])
+
     def test_for_FTDPABVF_0(self):
         '''
         Have it make sure _blanking_rule_for_others_left_blank is working by
@@ -169,8 +197,8 @@ def make_filled_form() -> dict:
         'a4sub': '0',
         'ftdppasl': '1',
         'ftdcpc2f': '95',  # _blanking_rule_ftld_q_noanswer
-        'ftdmrifa': '1',  # _blanking_rule_ftld_or2
-        'ftdmriob': '1',  # _blanking_rule_ftld_or2a
+        'ftdmrifa': '1',  # rules of the MRI fields
+        'ftdmriob': '1',  # rules of FTDMRIOS
         'ftdcppa': '1',  # _blanking_rule_for_others_left_blank "0" condition
         'ftdbvcln': '1',
         'ftdbvft': '3',  # _blanking_rule_for_others_left_blank "" condition
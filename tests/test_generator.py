@@ -1,7 +1,14 @@
 import csv
+import glob
+import importlib
 import io
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 
+from nacc.uds3 import schema
 from tools import generator
 
 
@@ -25,6 +32,106 @@ fields["REASON"] = nacc.uds3.Field(name="REASON", typename="Num", position=(45,
 
         self.assertEqual(expected, actual)
 
+    def test_json_schema(self):
+        a1_ivp_sample = """
+"DORDER","ITEM","VAR","PACKET","FLDLENG","COLUMN1","COLUMN2","DTYPE","RANGE","VALUES","VAL1D","VAL2D","VAL3D","VAL4D","VAL5D","VAL6D","VAL7D","VAL8D","VAL9D","VAL10D","MISSVALS","NEWQUEST","BLANKS"
+"1","1","REASON","I",1,45,45,1,"1||4","1||2||4||9","To participate in a research study","To have a clinical evaluation","Both (to participate in a research study and to have a clinical evaluation)","Unknown",,,,,,,"9","Primary reason for coming to ADC:",
+"2","2","BIRTHYR","I",4,47,50,1,"1875||current year minus 15","","",,,,,,,,,,,"Birth year","Blank if Question 1 REASON = 9 (Unknown)"
+        """.strip()
+
+        reader = csv.DictReader(io.StringIO(a1_ivp_sample))
+        form = generator.generate_form("A1", reader)
+        rows = [generator.field_to_schema(f) for f in form.fields]
+        self.assertEqual(rows[1], [
+            "BIRTHYR", "Num", [47, 50], 4, [1875, "CURRENT_YEAR - 15"], [""],
+            ["Blank if Question 1 REASON = 9 (Unknown)"]])
+
+        text = generator.schema_to_json([rows[0]], {"A1": rows[1:]})
+        self.assertEqual(json.loads(text),
+                         {"header": [rows[0]], "forms": {"A1": rows[1:]}})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "forms.json"), "w") as fp:
+                fp.write(text)
+            namespace = {"__file__": os.path.join(tmp, "forms.py"),
+                         "__name__": "forms"}
+            schema.define_forms(namespace)
+
+        a1 = namespace["FormA1"]()
+        self.assertListEqual(list(a1.fields), ["REASON", "BIRTHYR"])
+        self.assertEqual(a1.fields["BIRTHYR"].inclusive_range,
+                         (1875, schema.CURRENT_YEAR - 15))
+        self.assertEqual(a1.fields["BIRTHYR"].blanks,
+                         ("Blank if Question 1 REASON = 9 (Unknown)",))
+        a1.REASON = 9
+        self.assertEqual(a1.fields["REASON"].value, "9")
+        self.assertEqual(namespace["FormA1"]().fields["REASON"].value, " ")
+
+    def test_form_class_survives_failed_first_instance(self):
+        rows = [["REASON", "Num", [45, 45], 1, [1, 4], ["9"], []]]
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "forms.json"), "w") as fp:
+                fp.write(generator.schema_to_json([], {"A1": rows}))
+            namespace = {"__file__": os.path.join(tmp, "forms.py"),
+                         "__name__": "forms"}
+            schema.define_forms(namespace)
+
+        with mock.patch.object(schema, "_fields", side_effect=MemoryError):
+            with self.assertRaises(MemoryError):
+                namespace["FormA1"]()
+        self.assertListEqual(list(namespace["FormA1"]().fields), ["REASON"])
+
+    def test_range_bounds_keep_their_numbers(self):
+        self.assertEqual(generator._range_bound(98.9), 98.9)
+        self.assertEqual(generator._range_bound(3.2), 3.2)
+        self.assertEqual(generator._range_bound(4), 4)
+        self.assertEqual(generator._range_bound("98.9"), 98.9)
+        self.assertEqual(generator._range_bound("1875"), 1875)
+        self.assertEqual(generator._range_bound("CURRENT_YEAR - 15"),
+                         "CURRENT_YEAR - 15")
+
+        np = importlib.import_module("nacc.uds3.np.forms")
+        self.assertEqual(np.FormNP().fields["NPPMIH"].inclusive_range,
+                         (0, 98.9))
+
+    def test_compile_rules(self):
+        header = [["PTID", "Char", [1, 10], 10, None, [], []]]
+        forms = {"A1": [
+            ["REASON", "Num", [12, 12], 1, [1, 4], [], [
+                "Blank if Question 1 PTID ne 1 (Yes)",
+                "Blank if Question 1 PTID = 2-4"]],
+            ["LEARNED", "Num", [14, 14], 1, [1, 4], [], [
+                "Blank if Question 2a REFERSC ne 1"]]]}
+
+        generator.compile_rules(header, forms, "uds3")
+        self.assertEqual(header[0][7], [])
+        self.assertEqual(forms["A1"][0][7], [["value", "PTID", "ne", "1"],
+                                             ["range", "PTID", "=", 2, 4]])
+        self.assertEqual(forms["A1"][1][7], [["special"]])
+
+        forms["A1"][0][6].append("Blank If Question 1 PTID ne 1 (Yes)")
+        with self.assertRaises(Exception) as raised:
+            generator.compile_rules(header, forms, "uds3")
+        self.assertIn("A1 REASON: 'Blank If Question 1 PTID ne 1 (Yes)'",
+                      str(raised.exception))
+
+    def test_schemas_rules_are_compiled(self):
+        """ Every rule in the forms schemas is compiled by its family """
+        root = os.path.join(os.path.dirname(__file__), "..", "nacc")
+        paths = glob.glob(os.path.join(root, "**", "forms.json"),
+                          recursive=True)
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path) as fp:
+                schema_ = json.load(fp)
+            blanks = importlib.import_module(
+                "nacc.%s.blanks" % schema_["family"])
+            for rows in [schema_["header"]] + list(schema_["forms"].values()):
+                for row in rows:
+                    entries = [list(blanks.parse_rule(row[0], rule))
+                               for rule in row[6]]
+                    self.assertEqual(row[7], entries, (path, row[0]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import unittest
+
+from nacc import redcap2nacc
+
+LOADED_MODULES = '''
+import sys
+from nacc import redcap2nacc
+%s
+print(' '.join(sorted(m for m in sys.modules if m.startswith('nacc.'))))
+'''
+
+
+class TestLazyBuilders(unittest.TestCase):
+    '''
+    Importing redcap2nacc should not import any builder or forms module; a
+    builder's modules are only imported when it is used.
+    '''
+
+    def loaded_modules(self, statements=''):
+        output = subprocess.check_output(
+            [sys.executable, '-c', LOADED_MODULES % statements])
+        return output.decode().split()
+
+    def test_import_loads_no_builders(self):
+        loaded = self.loaded_modules()
+        self.assertListEqual([m for m in loaded if 'builder' in m or
+                              m.endswith('forms')], [])
+
+    def test_import_does_not_load_numpy(self):
+        # numpy is an optional dependency, only used by -batch
+        output = subprocess.check_output([sys.executable, '-c', (
+            "import sys\n"
+            "from nacc import redcap2nacc\n"
+            "redcap2nacc.parse_args(['-ivp'])\n"
+            "print('numpy' in sys.modules)")])
+        self.assertEqual(output.decode().strip(), 'False')
+
+    def test_selected_builder_is_loaded_on_first_use(self):
+        loaded = self.loaded_modules(
+            "redcap2nacc.select_builder("
+            "redcap2nacc.parse_args(['-csf'])).load()")
+        self.assertIn('nacc.csf.builder', loaded)
+        self.assertNotIn('nacc.uds3.ivp.builder', loaded)
+
+    def test_builder_modules_exist(self):
+        for builder in redcap2nacc.BUILDERS:
+            self.assertTrue(callable(builder.load()), builder.module)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from nacc.ftld import packet as ftld_packet
+from nacc.lbd import packet as lbd_packet
+from nacc.uds3 import packet
+from nacc.uds3.ivp import forms as ivp_forms
+
+
+class TestPacket(unittest.TestCase):
+    '''
+    The Packet keeps an index of field name to Field that has to stay in sync
+    with the forms as they are appended, inserted or removed.
+    '''
+
+    def test_lookup_after_append(self):
+        ipacket = packet.Packet()
+        a1 = ivp_forms.FormA1()
+        b8 = ivp_forms.FormB8()
+        ipacket.append(a1)
+        ipacket.extend([b8])
+
+        self.assertIs(ipacket['HISPANIC'], a1.fields['HISPANIC'])
+        self.assertIs(ipacket['PARKSIGN'], b8.fields['PARKSIGN'])
+        self.assertIs(ipacket[1], b8)
+        with self.assertRaises(KeyError):
+            ipacket['NOTAFIELD']
+
+    def test_insert_changes_first_form(self):
+        ipacket = packet.Packet()
+        a1 = ivp_forms.FormA1()
+        z1x = ivp_forms.FormZ1X()
+        ipacket.append(a1)
+        self.assertIs(ipacket['PTID'], a1.fields['PTID'])
+
+        ipacket.insert(0, z1x)
+        self.assertIs(ipacket['PTID'], z1x.fields['PTID'])
+
+        ipacket.remove(z1x)
+        self.assertIs(ipacket['PTID'], a1.fields['PTID'])
+
+    def test_a4d_fields_are_not_accessible(self):
+        ipacket = packet.Packet()
+        ipacket.append(ivp_forms.FormA4G())
+        ipacket.append(ivp_forms.FormA4D())
+        ipacket.append(ivp_forms.FormA4D())
+
+        with self.assertRaises(KeyError):
+            ipacket['DRUGID']
+        self.assertEqual(ipacket['ANYMEDS'].name, 'ANYMEDS')
+
+    def test_lbd_and_ftld_packets_share_the_index(self):
+        for family_packet in (lbd_packet.Packet(), ftld_packet.Packet()):
+            a1 = ivp_forms.FormA1()
+            family_packet.append(a1)
+            self.assertIs(family_packet['SEX'], a1.fields['SEX'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import csv
+import io
+import unittest
+
+from nacc import redcap2nacc
+from tests.test_csf_blanks import make_filled_form
+
+
+class TestParallelConvert(unittest.TestCase):
+    '''
+    Converting with several worker processes should write exactly the same
+    output and diagnostics, in the same order, as converting serially.
+    '''
+
+    def make_csv(self):
+        records = []
+        for i in range(1, 41):
+            record = make_filled_form()
+            record['ptid'] = str(i)
+            if i % 5 == 0:
+                # Violates "Blank if Question 1a CSFABETA = blank"
+                record['csfabeta'] = ''
+            if i % 7 == 0:
+                # Out of range month makes the builder fail
+                record['csfabmo'] = '13'
+            records.append(record)
+
+        data = io.StringIO()
+        writer = csv.DictWriter(data, fieldnames=list(records[0].keys()))
+        writer.writeheader()
+        writer.writerows(records)
+        return data.getvalue()
+
+    def run_convert(self, data, jobs):
+        options = redcap2nacc.parse_args(['-csf'])
+        out = io.StringIO()
+        err = io.StringIO()
+        redcap2nacc.convert(io.StringIO(data), options, out, err, jobs=jobs)
+        return out.getvalue(), err.getvalue()
+
+    def test_parallel_matches_serial(self):
+        data = self.make_csv()
+        serial_out, serial_err = self.run_convert(data, jobs=1)
+        parallel_out, parallel_err = self.run_convert(data, jobs=3)
+
+        self.assertEqual(serial_out, parallel_out)
+        self.assertEqual(serial_err, parallel_err)
+        self.assertIn("[SKIP] Error for ptid : 5", serial_err)
+        self.assertIn("[SKIP] Error for ptid : 7", serial_err)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import decimal
+import threading
+import unittest
+
+from nacc.uds3 import Char, Field, Num
+
+
+class TestUdsTypes(unittest.TestCase):
+    '''
+    Num and Char keep no state between calls, so one instance can coerce
+    values for any number of fields and threads.
+    '''
+
+    def test_num_canonical_strings(self):
+        num = Num(3)
+        self.assertEqual(num(None), '   ')
+        self.assertEqual(num(''), '   ')
+        self.assertEqual(num('88'), '88 ')
+        self.assertEqual(num(7), '7  ')
+        self.assertEqual(num('3.1'), '3.1')
+        self.assertEqual(num('-1'), '-1 ')
+
+    def test_num_rejects_non_numbers(self):
+        num = Num(3)
+        for value in ('abc', '²'):
+            with self.assertRaises(decimal.InvalidOperation):
+                num(value)
+
+    def test_types_are_hashable_and_compare_by_length(self):
+        self.assertEqual(Num(2), Num(2))
+        self.assertNotEqual(Num(2), Num(3))
+        self.assertNotEqual(Num(2), Char(2))
+        self.assertEqual(len({Num(2), Num(2), Char(2)}), 2)
+
+    def test_shared_instance_across_threads(self):
+        num = Num(4)
+        errors = []
+
+        def coerce(value):
+            for _ in range(2000):
+                if num(value) != str(value).ljust(4):
+                    errors.append(value)
+
+        threads = [threading.Thread(target=coerce, args=(str(i),))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(errors, [])
+
+    def test_within_matches_range_membership(self):
+        field = Field(name='X', typename='Num', position=(1, 3), length=3,
+                      inclusive_range=(0, 999))
+        for value in ('', '0', '1', '5', '05', '12', '13', '3.0', '888'):
+            field.val = value
+            self.assertEqual(field.within(1, 12), field in range(1, 13),
+                             value)
+
+
+if __name__ == "__main__":
+    unittest.main()
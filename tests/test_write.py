@@ -0,0 +1,42 @@
+import unittest
+
+from nacc.uds3.ivp import forms as ivp_forms
+
+
+class TestWrite(unittest.TestCase):
+    '''
+    Forms are written using a layout compiled once per form class, which has
+    to give the same fixed-width record for every instance.
+    '''
+
+    def test_write_places_fields_at_their_positions(self):
+        a1 = ivp_forms.FormA1()
+        a1.FORMID = 'A1'
+        a1.PTID = '110001'
+        a1.SEX = '2'
+        record = a1.write()
+
+        self.assertEqual(len(record), a1.fields['HANDED'].position[1])
+        self.assertEqual(record[3:6], 'A1 ')
+        self.assertEqual(record[14:24], '110001    ')
+        self.assertEqual(record[64], '2')
+        self.assertEqual(record[65:], ' ' * (len(record) - 65))
+
+    def test_instances_share_layout(self):
+        first = ivp_forms.FormB7()
+        second = ivp_forms.FormB7()
+        first.write()
+        second.write()
+        self.assertIs(first._layout(), second._layout())
+
+    def test_invalid_length_names_field_and_form(self):
+        a1 = ivp_forms.FormA1()
+        a1.FORMID = 'A1'
+        a1.fields['SEX'].val = '22'
+        with self.assertRaises(AssertionError) as cm:
+            a1.write()
+        self.assertIn('SEX in form A1', str(cm.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+"""Measures how long checking the blanking rules of an FTLD IVP packet takes
+
+Usage: python3 tools/blanks_benchmark.py [-n PACKETS] [-seed SEED]
+
+A synthetic FTLD IVP packet is made for each run, with every field of every
+form set to one of its allowed values (or left blank), so the imaging fields
+of form E3F and the questions they depend on take every combination. Like
+most packets that are submitted, the fields that should be blank are then
+blanked. Reports the median time check_blanks takes for a packet, and how
+many conditions it evaluates for the rules of the fields.
+
+The same packets are also checked the way check_blanks did before its rules
+were indexed by condition: every rule is compiled on its own and each field
+that has a value evaluates the conditions of its own rules. Reports the
+median time of that baseline and how many times slower it is.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from nacc import redcap2nacc
+from nacc.ftld import packet as ftld_packet
+from nacc.ftld.ivp import forms as ftld_ivp_forms
+
+
+class Options(object):
+    ftld = True
+    ivp = True
+    lbd = False
+    csf = False
+    cv = False
+
+
+def field_values(field):
+    """ Returns the values a field of the synthetic packets can be set to """
+    spec = field.spec
+    values = [''] + sorted(v.strip() for v in spec.allowable_values)
+    if spec.inclusive_range:
+        low, high = (int(b) for b in spec.inclusive_range)
+        values.extend(str(v) for v in (low, high, (low + high) // 2))
+    if len(values) == 1:
+        values.append('x' * min(spec.length, 3))
+    return values
+
+
+def per_rule_checks(packet, families):
+    """
+    Returns the rules of the fields of each form of the packet, each compiled
+    on its own, as lists of (field key, rule, predicate)
+    """
+    checks = []
+    for form in packet:
+        rules = []
+        for key, field in form.fields.items():
+            for rule in field.blanks:
+                for family in families:
+                    entry = redcap2nacc._blanking_rule_entry(
+                        family, field.name, rule)
+                    predicate = redcap2nacc.BLANKS_MODULES[family] \
+                        .compile_rule(field.name, rule, entry)
+                    rules.append((key, rule, predicate))
+        checks.append(rules)
+    return checks
+
+
+def check_blanks_per_rule(packet, checks):
+    """
+    Checks the blanking rules of the packet without the index of conditions,
+    like check_blanks did before: each field with a value evaluates its rules
+    """
+    warnings = []
+    for form, rules in zip(packet, checks):
+        formid = redcap2nacc._formid(form)
+        for key, rule, predicate in rules:
+            field = form.fields[key]
+            if not redcap2nacc.empty(field) and predicate(packet):
+                redcap2nacc.blank_warnings(warnings, field.name, formid,
+                                           field.value, len(field.value),
+                                           rule)
+    return warnings
+
+
+def make_packet(rng, options):
+    """
+    Returns an FTLD IVP packet with every form, filled at random and then
+    with the fields that should be blank blanked
+    """
+    packet = ftld_packet.Packet()
+    for name in sorted(dir(ftld_ivp_forms)):
+        if not name.startswith('Form'):
+            continue
+        form = getattr(ftld_ivp_forms, name)()
+        for key in sorted(form.fields):
+            field = form.fields[key]
+            field.value = rng.choice(field_values(field))
+        packet.append(form)
+
+    # blanking a field can change whether the rules of others hold
+    for _ in range(10):
+        warnings = redcap2nacc.check_blanks(packet, options)
+        if not warnings:
+            break
+        for warning in warnings:
+            packet[warning.split()[0]].value = ''
+    return packet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', dest='packets', type=int, default=2000,
+                        help='Number of packets to check')
+    parser.add_argument('-seed', dest='seed', type=int, default=0,
+                        help='Seed of the values of the packets')
+    options = parser.parse_args()
+
+    rng = random.Random(options.seed)
+    check = Options()
+    packets = [make_packet(rng, check) for _ in range(options.packets)]
+
+    families = tuple(redcap2nacc.blanking_rule_families(check))
+    checks = per_rule_checks(packets[0], families)
+
+    times = []
+    baseline_times = []
+    warnings = 0
+    for packet in packets:
+        start = time.perf_counter()
+        found = redcap2nacc.check_blanks(packet, check)
+        times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        baseline = check_blanks_per_rule(packet, checks)
+        baseline_times.append(time.perf_counter() - start)
+
+        if found != baseline:
+            raise SystemExit("The baseline gave other warnings:\n%s\n%s"
+                             % ("\n".join(found), "\n".join(baseline)))
+        warnings += len(found)
+
+    rules = conditions = 0
+    for form in packets[0]:
+        index = redcap2nacc._blanking_index(form, families)
+        conditions += len(index.conditions)
+        rules += sum(len(dependents) for _, _, dependents in index.conditions)
+
+    median = statistics.median(times)
+    baseline_median = statistics.median(baseline_times)
+    print("%-24s %8.1f us" % ('check_blanks per packet', median * 1e6))
+    print("%-24s %8.1f us" % ('baseline per packet', baseline_median * 1e6))
+    print("%-24s %8.1f x" % ('speedup', baseline_median / median))
+    print("%-24s %8d" % ('rules', rules))
+    print("%-24s %8d" % ('conditions', conditions))
+    print("%-24s %8.1f" % ('warnings per packet', warnings / len(packets)))
+
+
+if __name__ == '__main__':
+    main()
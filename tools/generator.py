@@ -12,10 +12,20 @@ Usage: python3 tools/generator.py -h|--help
        python3 tools/generator.py <deds>
        python3 tools/generator.py <deds> <header>
        python3 tools/generator.py <deds> <header> <corrections>
+       python3 tools/generator.py --json[=FAMILY] <deds> ...
+       python3 tools/generator.py --rules <schema>
 
 Form Generator creates Python code from NACC Data Element Dictionaries stored
 as CSV files.
 
+  --json       Print the forms as a schema (a forms.json file) instead, which
+               nacc.uds3.schema.define_forms builds the form classes from.
+               The blanking rules are compiled into the schema with the
+               parser of nacc/FAMILY/blanks.py (defaults to "uds3"), and
+               any rule it cannot parse is reported.
+  --rules      Compile the blanking rules of a schema again, after its rules
+               were corrected by hand
+
   deds         Path to the directory containing the DED CSV files
   header       Filename of the header file within <deds>
                Defaults to "uds3dedheader.csv".
@@ -27,6 +37,8 @@ Note: the CSV versions of the DEDs are found on the NACC website with the form:
 """
 
 import csv
+import importlib
+import json
 import os
 import re
 import sys
@@ -78,6 +90,76 @@ def fields_to_strings(fields, this="self.") -> typing.Iterable[str]:
         yield code
 
 
+def field_to_schema(field) -> list:
+    """
+    Returns a field as a row of a form schema: its name, type, position,
+    length, inclusive range, allowable codes and blanking rules
+    """
+    inclusive_range = field.inclusive_range
+    if inclusive_range:
+        inclusive_range = [_range_bound(bound) for bound in inclusive_range]
+
+    return [str(field.name), field.type, list(field.position),
+            int(field.length), inclusive_range, field.allowable_codes,
+            field.blanks]
+
+
+def _range_bound(bound):
+    """ Returns a bound as a number, unless it is relative to CURRENT_YEAR """
+    if isinstance(bound, (int, float)):
+        return bound
+    for number in (int, float):
+        try:
+            return number(bound)
+        except ValueError:
+            pass
+    return bound
+
+
+def compile_rules(header, forms, family) -> None:
+    """
+    Adds the compiled blanking rules to each row of a schema, after its
+    blanking rules: a list with the entry parse_rule (in
+    nacc/<family>/blanks.py) makes for each rule. Raises an exception
+    listing every rule that cannot be parsed.
+    """
+    blanks = importlib.import_module("nacc.%s.blanks" % family)
+    errors = []
+    for form_id, rows in [("header", header)] + list(forms.items()):
+        for row in rows:
+            name, rules = row[0], row[6]
+            entries = []
+            for rule in rules:
+                try:
+                    entries.append(list(blanks.parse_rule(name, rule)))
+                except Exception:
+                    errors.append("%s %s: %r" % (form_id, name, rule))
+            row[7:] = [entries]
+
+    if errors:
+        raise Exception("Could not parse Blanking rules:\n  " +
+                        "\n  ".join(errors))
+
+
+def schema_to_json(header, forms, family=None) -> str:
+    """
+    Returns the schema of a form set as JSON, with the header rows and the
+    rows of each form by form id. Each row is on its own line, so a change
+    to a field is a one line change. `family` is the family whose parser
+    compiled the blanking rules, if they were.
+    """
+    def rows(fields, tabs):
+        return (",\n" + tabs).join(json.dumps(field) for field in fields)
+
+    form_rows = ",\n".join(
+        '    %s: [\n        %s\n    ]' % (json.dumps(form_id),
+                                          rows(fields, " " * 8))
+        for form_id, fields in forms.items())
+    family_line = '"family": %s,\n' % json.dumps(family) if family else ""
+    return '{\n%s"header": [\n    %s\n],\n"forms": {\n%s\n}\n}\n' % (
+        family_line, rows(header, " " * 4), form_rows)
+
+
 def form_to_string(form: DynamicObject, class_prefix: str = "") -> str:
     """ Returns headers with "self.fields" Python tags """
 
@@ -210,28 +292,56 @@ def main():
     ded_header = "uds3dedheader.csv"
     corrected_path = ""
 
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    family = None
+    if args and args[0].split("=")[0] == "--json":
+        family = args[0].partition("=")[2] or "uds3"
+        args = args[1:]
+
+    if args[:1] == ["--rules"] and len(args) == 2:
+        with open(args[1]) as stream:
+            schema = json.load(stream)
+        compile_rules(schema["header"], schema["forms"], schema["family"])
+        with open(args[1], "w") as stream:
+            stream.write(schema_to_json(schema["header"], schema["forms"],
+                                        schema["family"]))
+        return
+
+    if len(args) < 1:
         usage()
         sys.exit(2)
 
-    if sys.argv[1] in ["-h", "--help"]:
+    if args[0] in ["-h", "--help"]:
         usage()
         sys.exit(0)
 
-    if len(sys.argv) > 1:
-        deds_path = sys.argv[1]
+    if len(args) > 0:
+        deds_path = args[0]
 
-    if len(sys.argv) > 2:
-        ded_header = sys.argv[2]
+    if len(args) > 1:
+        ded_header = args[1]
 
-    if len(sys.argv) > 3:
-        corrected_path = sys.argv[3]
+    if len(args) > 2:
+        corrected_path = args[2]
 
     # Search deds_path for CSV files, excluding the ded_header.
     deds = [filename for filename in os.listdir(deds_path)
             if filename.endswith(".csv") and filename != ded_header]
     deds = sorted(deds)
 
+    if family:
+        header = generate_header(os.path.join(deds_path, ded_header))
+        header = [field_to_schema(field)
+                  for field in sort_by_starting_position(header.fields)]
+        forms = {}
+        for ded in deds:
+            form = generate(_corrected(deds_path, ded, corrected_path))
+            forms[form.id] = [field_to_schema(field) for field in
+                              sort_by_starting_position(form.fields)]
+        compile_rules(header, forms, family)
+        print(schema_to_json(header, forms, family), end="")
+        return
+
     # Generate the Python module starting with the preamble, then the common
     # header fields, and finally the classes which represents the Forms.
     print("""# Generated using the NACCulator form generator tool.
@@ -255,13 +365,7 @@ def header_fields():
     print("")
 
     for ded in deds:
-        dedpath = os.path.join(deds_path, ded)
-        if corrected_path:
-            corrected = os.path.join(corrected_path, ded)
-            if os.path.isfile(corrected):
-                dedpath = corrected
-
-        form = generate(dedpath)
+        form = generate(_corrected(deds_path, ded, corrected_path))
         fields = sort_by_starting_position(form.fields)
         fields = fields_to_strings(fields)
 
@@ -272,6 +376,15 @@ def header_fields():
         print("")
 
 
+def _corrected(deds_path, ded, corrected_path):
+    """ Returns the path of the corrected DED, if there is one """
+    if corrected_path:
+        corrected = os.path.join(corrected_path, ded)
+        if os.path.isfile(corrected):
+            return corrected
+    return os.path.join(deds_path, ded)
+
+
 def sort_by_starting_position(fields: typing.List[DynamicObject]) \
         -> typing.List[DynamicObject]:
     """ Sorts fields by their starting positions """
@@ -0,0 +1,62 @@
+###############################################################################
+# Copyright 2015-2022 University of Florida. All rights reserved.
+# This file is part of UF CTS-IT's NACCulator project.
+# Use of this source code is governed by the license found in the LICENSE file.
+###############################################################################
+
+"""Measures how long redcap2nacc takes to start
+
+Usage: python3 tools/import_benchmark.py [-n RUNS]
+
+Each measurement runs in a fresh Python process and reports the median of the
+runs: importing nacc.redcap2nacc, and then loading the builder of each packet
+type on its first use. Importing redcap2nacc should not import any builder.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from nacc import redcap2nacc
+
+MEASURE = '''
+import sys, time
+start = time.perf_counter()
+from nacc import redcap2nacc
+imported = time.perf_counter()
+builders = [b for b in redcap2nacc.BUILDERS if b.flags == %r]
+for builder in builders:
+    builder.load()
+loaded = time.perf_counter()
+print(imported - start, loaded - imported)
+'''
+
+
+def measure(flags, runs):
+    imports = []
+    loads = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', MEASURE % (flags,)])
+        imported, loaded = map(float, output.split())
+        imports.append(imported)
+        loads.append(loaded)
+    return statistics.median(imports), statistics.median(loads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', dest='runs', type=int, default=5,
+                        help='Number of runs to take the median of')
+    options = parser.parse_args()
+
+    imported, _ = measure((), options.runs)
+    print("%-16s %8.1f ms" % ('import', imported * 1000))
+    for builder in redcap2nacc.BUILDERS:
+        _, loaded = measure(builder.flags, options.runs)
+        print("%-16s %8.1f ms" % ('+'.join(builder.flags), loaded * 1000))
+
+
+if __name__ == '__main__':
+    main()